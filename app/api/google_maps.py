@@ -7,9 +7,13 @@ and also includes a fallback mechanism using Google Maps Scraper for complex que
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+import asyncio
 import logging
+import orjson
+import re
 from app.utils.database import generate_business_hash
 
 from app.models.google_maps_lead import GoogleMapsLead
@@ -18,16 +22,42 @@ from app.services.google_maps_service import fetch_leads_from_google_maps, VALID
 from app.services.gmaps_scraping_service import GoogleMapsScraper, VALID_SCRAPING_FIELDS
 from app.utils.auth import get_current_user
 from app.tasks import TaskManager
-from app.utils.string_matching import find_exact_match, find_best_matches
-from app.utils.config import VALID_BUSINESS_TYPES
+from app.utils.string_matching import find_exact_match, select_business_types
+from app.utils.config import VALID_BUSINESS_TYPES, VALID_BUSINESS_TYPES_SET
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 task_manager = TaskManager()
 
+# Field names accepted in requests, built once instead of per validation
+VALID_REQUEST_FIELDS = frozenset(FIELD_MAPPINGS.keys())
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Length bounds for business types passed to fuzzy matching
+MIN_FUZZY_QUERY_LENGTH = 2
+MAX_FUZZY_QUERY_LENGTH = 64
+# Number of leads serialized per chunk when streaming results
+RESULT_STREAM_CHUNK_SIZE = 100
+
+def stream_json_array(items: List[Dict[str, Any]], chunk_size: int = RESULT_STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Serialize a list as a JSON array, yielding it in chunks of items.
+
+    Args:
+        items (List[Dict[str, Any]]): The items to serialize.
+        chunk_size (int): Number of items encoded per yielded chunk.
+
+    Yields:
+        bytes: Successive pieces of the JSON array.
+    """
+    yield b"["
+    for start in range(0, len(items), chunk_size):
+        chunk = b",".join(orjson.dumps(item) for item in items[start:start + chunk_size])
+        yield chunk if start == 0 else b"," + chunk
+    yield b"]"
+
 class GoogleMapsLeadRequest(BaseModel):
     """
     Request model for Google Maps lead fetching.
@@ -39,7 +69,9 @@ class GoogleMapsLeadRequest(BaseModel):
     @field_validator('query', mode='before')
     @classmethod
     def validate_query(cls, v):
-        if not v.strip():
+        # Collapse runs of whitespace so equivalent queries share caches downstream
+        v = WHITESPACE_PATTERN.sub(' ', v).strip()
+        if not v:
             raise ValueError('Query must not be empty')
         return v
 
@@ -47,17 +79,15 @@ class GoogleMapsLeadRequest(BaseModel):
     @classmethod
     def validate_fields(cls, v):
         if v is not None:
-            # Get valid fields from FIELD_MAPPINGS
-            valid_fields = set(FIELD_MAPPINGS.keys())
-            invalid_fields = [field for field in v if field not in valid_fields]
+            invalid_fields = [field for field in v if field not in VALID_REQUEST_FIELDS]
             if invalid_fields:
                 raise ValueError(
                     f"Invalid fields: {', '.join(invalid_fields)}. "
-                    f"Valid fields are: {', '.join(valid_fields)}"
+                    f"Valid fields are: {', '.join(VALID_REQUEST_FIELDS)}"
                 )
         return v
 
-@router.post("/", response_model=dict, summary="Queue a task to get leads from Google Maps")
+@router.post("/", response_class=ORJSONResponse, summary="Queue a task to get leads from Google Maps")
 async def queue_google_maps_leads(
     request: GoogleMapsLeadRequest,
     background_tasks: BackgroundTasks,
@@ -67,29 +97,34 @@ async def queue_google_maps_leads(
         # Parse the query
         business_type, location, _ = parse_complex_query(request.query)
         
+        matched_business_types = None
         if business_type:
-            # Try to find exact match first
-            exact_match = find_exact_match(business_type, VALID_BUSINESS_TYPES)
+            # Try a direct set lookup, then stemmed exact matching, before any fuzzy matching
+            if business_type in VALID_BUSINESS_TYPES_SET:
+                exact_match = business_type
+            else:
+                exact_match = find_exact_match(business_type, VALID_BUSINESS_TYPES)
             if exact_match:
                 logger.info(f"Found exact match for business type: {exact_match}")
-                business_type = exact_match
+                matched_business_types = [exact_match]
+            elif not MIN_FUZZY_QUERY_LENGTH <= len(business_type) <= MAX_FUZZY_QUERY_LENGTH:
+                logger.warning(f"Skipping fuzzy matching for business type of length {len(business_type)}, will use scraper")
             else:
-                # Try fuzzy matching
-                best_matches = find_best_matches(business_type)
-                if best_matches:
-                    logger.info(f"Found fuzzy match for business type: {best_matches[0]}")
-                    business_type = best_matches[0]
+                # Try fuzzy matching; only near-tied direct matches are searched together in one request
+                fuzzy_matches = select_business_types(business_type)
+                if fuzzy_matches:
+                    matched_business_types = fuzzy_matches
+                    logger.info(f"Found fuzzy matches for business type: {matched_business_types}")
                 else:
                     logger.warning(f"No valid business type match found for '{business_type}', will use scraper")
-                    business_type = None
 
-        # Queue the task with the validated/matched business type
+        # Queue the task with the validated/matched business types
         task_id = await task_manager.fetch_leads(
             query=request.query,
             max_leads=request.max_leads,
             fields=request.fields,
             user_id=user_id,
-            matched_business_type=business_type  # Pass the matched business type to the task
+            matched_business_types=matched_business_types  # Pass the matched business types to the task
         )
 
         return {
@@ -106,18 +141,20 @@ async def queue_google_maps_leads(
         logger.error(f"Error in queue_google_maps_leads: {str(e)}")
         raise HTTPException(status_code=500, detail=f"An error occurred while processing your request: {str(e)}")
 
-@router.get("/status/{task_id}", summary="Get task status")
+@router.get("/status/{task_id}", response_class=ORJSONResponse, summary="Get task status")
 async def get_task_status(task_id: str, user_id: str = Depends(get_current_user)):
-    status = task_manager.get_task_status(task_id, user_id)
+    status = await asyncio.to_thread(task_manager.get_task_status, task_id, user_id)
     if status is None:
         raise HTTPException(status_code=404, detail="Task not found or unauthorized")
-    return status
+    # Completed statuses embed the full lead list; return it directly to skip jsonable_encoder
+    return ORJSONResponse(status)
 
-@router.get("/result/{task_id}", summary="Get task result")
+@router.get("/result/{task_id}", response_class=StreamingResponse, summary="Get task result")
 async def get_task_result(task_id: str, user_id: str = Depends(get_current_user)):
-    status = task_manager.get_task_status(task_id, user_id)
+    status = await asyncio.to_thread(task_manager.get_task_status, task_id, user_id)
     if status is None:
         raise HTTPException(status_code=404, detail="Task not found or unauthorized")
     if status["status"] != "completed":
         raise HTTPException(status_code=400, detail="Task has not completed yet")
-    return status["result"]
+    # Stream large lead lists instead of encoding them into a single response body
+    return StreamingResponse(stream_json_array(status["result"]), media_type="application/json")
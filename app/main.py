@@ -5,9 +5,14 @@ This module initializes and configures the main FastAPI application.
 It sets up routers, middleware, and global exception handlers.
 """
 
+import atexit
+import logging
 import os
+import queue
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.openapi.utils import get_openapi
 from dotenv import load_dotenv
 from fastapi.middleware.cors import CORSMiddleware
@@ -16,17 +21,41 @@ from app.api import google_maps, shopify
 try:
     from app.utils.database import SupabaseClientSingleton
 except ImportError:
-    print("Error importing SupabaseClientSingleton. Make sure the file exists and the class is defined.")
+    logging.getLogger(__name__).error("Error importing SupabaseClientSingleton. Make sure the file exists and the class is defined.")
     SupabaseClientSingleton = None
 
 # Load environment variables (locally, uncomment when deploying)
 load_dotenv()
 
+# Configure logging once for the whole application; records are queued and written by a
+# background listener thread so request handlers never block on stream I/O
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)], force=True)
+log_listener = QueueListener(log_queue, logging.StreamHandler(), respect_handler_level=True)
+log_listener.start()
+# Stop (and flush) at interpreter exit rather than on lifespan shutdown, so records logged after the
+# lifespan ends, or during a later startup in the same process, are still written
+atexit.register(log_listener.stop)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm up shared clients at startup and keep them on the application state,
+    where request dependencies such as ``get_supabase`` read them.
+
+    Args:
+        app (FastAPI): The application instance.
+    """
+    app.state.supabase = SupabaseClientSingleton.get_instance()
+    yield
+
 # Create FastAPI app
 app = FastAPI(
     title="DataPull API",
     version="1.0.0",
     description="API for generating and enriching leads from multiple sources.",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -39,9 +68,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize Supabase client
-supabase_client = SupabaseClientSingleton.get_instance()
-
 # Include routers
 app.include_router(google_maps.router, prefix="/leads/google_maps", tags=["Google Maps Leads"])
 app.include_router(shopify.router, prefix="/leads/shopify", tags=["Shopify Leads"])
@@ -115,4 +141,4 @@ app.openapi = custom_openapi
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, HttpUrl, AnyUrl
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, HttpUrl, AnyUrl, TypeAdapter
+from typing import Optional, List, Dict, Any, TypedDict
 from uuid import uuid4
 
 class GoogleMapsLead(BaseModel):
@@ -24,3 +24,27 @@ class GoogleMapsLead(BaseModel):
         json_encoders = {
             AnyUrl: str
         }
+
+
+# Validates and serializes whole lists of leads in a single pydantic-core pass
+GOOGLE_MAPS_LEADS_ADAPTER = TypeAdapter(List[GoogleMapsLead])
+
+# Shape of the raw lead dicts produced by the Places API search and the scraper,
+# before they are validated into GoogleMapsLead
+class GoogleMapsLeadDict(TypedDict, total=False):
+    id: str
+    name: str
+    business_phone: Optional[str]
+    formatted_address: Optional[str]
+    website: Optional[str]
+    rating: Optional[float]
+    user_ratings_total: Optional[int]
+    types: List[str]
+    business_status: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    additional_properties: Dict[str, Any]
+    images: Optional[List[str]]
+    reviews: Optional[List[Dict[str, Any]]]
+    similar_businesses: Optional[List[Dict[str, Any]]]
+    about: Optional[str]
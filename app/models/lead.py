@@ -34,13 +34,7 @@ class LeadCreate(BaseModel):
     source_attributes: Optional[Dict[str, Any]] = Field(default_factory=dict)
 
     class Config:
-        extra = "allow"  # This allows extra fields that are not defined in the model
-
-    def dict(self, *args, **kwargs):
-        # Custom dict method to include extra fields
-        d = super().dict(*args, **kwargs)
-        d.update({k: v for k, v in self.__dict__.items() if k not in d})
-        return d
+        extra = "forbid"  # Source-specific data belongs in source_attributes; unknown fields are rejected
 
 # Model for lead response with timestamps
 class LeadResponse(LeadBase):
@@ -6,17 +6,21 @@ It uses Selenium WebDriver to navigate and extract data from Google Maps search
 """
 
 import logging
+import os
+import random
 import re
 import traceback
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache
 from queue import Queue
 from threading import Lock
 from typing import Any, Dict, List, Optional, Set
 import urllib.parse
 import asyncio
 import time
-import json
+
+import orjson
 
 from selenium import webdriver
 from selenium.common.exceptions import (
@@ -31,14 +35,7 @@ from selenium.webdriver.chrome.options import Options as ChromeOptions
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from urllib.parse import parse_qs, urlparse
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler()],
-)
+from urllib.parse import urlparse
 
 # Define valid fields for scraping
 VALID_SCRAPING_FIELDS = {
@@ -47,6 +44,236 @@ VALID_SCRAPING_FIELDS = {
     "images", "reviews", "similar_businesses", "about"
 }
 
+# Coordinates embedded in place URLs, e.g. ".../data=!4m7!3m6!...!3d41.88!4d-87.63!..."
+COORDS_PATTERN = re.compile(r'!3d(-?\d+\.\d+)!4d(-?\d+\.\d+)')
+# Map viewport in place URLs, e.g. ".../place/Name/@41.88,-87.63,17z/..."
+AT_COORDS_PATTERN = re.compile(r'/@(-?\d+\.\d+),(-?\d+\.\d+)')
+
+# Patterns used while extracting card, panel and review data
+RATING_PATTERN = re.compile(r"(\d+(\.\d+)?)")
+REVIEW_COUNT_PATTERN = re.compile(r"(\d+)")
+PLACE_ID_PATTERN = re.compile(r"ChIJ\w+")
+BACKGROUND_IMAGE_PATTERN = re.compile(r'url\("(.+?)"\)')
+RELATIVE_DATE_PATTERN = re.compile(r'(\d+)\s*(year|month|week|day|hour|minute)s?')
+PHONE_NUMBER_PATTERN = re.compile(r'^\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}$')
+
+# Patterns used by _clean_address to strip hours, phones and punctuation from card text
+# Hours, weekdays, open/closed labels and phone numbers, stripped in a single pass
+ADDRESS_NOISE_PATTERN = re.compile(
+    r'(?P<hours>\d{1,2}(?::\d{2})?\s*[ap]m)'
+    r'|(?P<day>\b(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\b)'
+    r'|(?P<state>\b(?:Open|Closed|Opens|Closes)\b)'
+    r'|(?P<phone>\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})',
+    re.IGNORECASE,
+)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+STREET_ADDRESS_PATTERN = re.compile(r'\d+\s+[A-Za-z0-9\s]+')
+# Compiled business-type variation patterns kept for reuse across result cards
+BUSINESS_TYPE_PATTERN_CACHE_SIZE = 256
+
+# Reads the fields of every result card from index arguments[0] on in a single WebDriver call
+CARD_EXTRACTION_SCRIPT = """
+const text = (element) => element ? element.innerText : null;
+return Array.from(document.querySelectorAll("div.Nv2PK")).slice(arguments[0]).map((card) => {
+    const link = card.querySelector("a.hfpxzc");
+    const website = card.querySelector("a.lcr4fd[data-value='Website']");
+    return {
+        name: text(card.querySelector("div.qBF1Pd")),
+        href: link ? link.href : null,
+        texts: Array.from(card.querySelectorAll("div.W4Efsd"), text),
+        website: website ? website.href : null
+    };
+});
+"""
+
+# True once more than arguments[0] result cards are loaded or the end-of-list marker is shown
+FEED_LOADED_SCRIPT = """
+if (document.querySelectorAll("div.Nv2PK").length > arguments[0]) {
+    return true;
+}
+const xpath = `//span[contains(text(), "You've reached the end of the list")]`;
+return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+"""
+
+# Seconds between condition checks in WebDriver waits
+WAIT_POLL_FREQUENCY = 0.1
+
+# Seconds to wait for more results to load after a scroll
+SCROLL_LOAD_TIMEOUT = 5
+
+# Browser viewport as "width,height"
+CHROME_WINDOW_SIZE = "1920,3000"
+
+# Resources blocked in every scraping session
+BLOCKED_URL_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf"]
+
+# Maximum number of page source characters written to the log when a page fails to load
+PAGE_SOURCE_LOG_LIMIT = 64 * 1024
+
+# Chrome content settings applied to every scraping session (2 = block)
+CHROME_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+}
+
+# Retry policy for single business detail pages
+DETAIL_MAX_RETRIES = 3
+DETAIL_RETRY_BACKOFF_INITIAL = 2.0  # seconds
+DETAIL_RETRY_BACKOFF_MAX = 10.0  # seconds
+
+# Page loads allowed per second for each host
+SCRAPER_REQUESTS_PER_SECOND = float(os.getenv('SCRAPER_REQUESTS_PER_SECOND', 2))
+
+@lru_cache(maxsize=None)
+def _keyword_number_pattern(keyword: str) -> re.Pattern:
+    """
+    Compile (once per keyword) the pattern matching a number followed by a keyword.
+
+    Args:
+        keyword (str): The keyword following the number, e.g. "review".
+
+    Returns:
+        re.Pattern: The compiled pattern capturing the number.
+    """
+    return re.compile(rf'(\d+)\s*{keyword}')
+
+@lru_cache(maxsize=BUSINESS_TYPE_PATTERN_CACHE_SIZE)
+def _business_type_pattern(business_type: str) -> re.Pattern:
+    """
+    Compile (once per business type) the pattern matching its spelling variations in an address.
+
+    Args:
+        business_type (str): The business type shown on a result card, e.g. "Car wash".
+
+    Returns:
+        re.Pattern: A case-insensitive alternation of the variations, longest first so they
+        win over their own prefixes.
+    """
+    business_type_variations = [
+        business_type.lower(),
+        business_type.replace(' ', ''),
+        business_type.replace('/', ' '),
+        business_type.replace('&', 'and'),
+        business_type.replace('and', '&'),
+        'Association',
+        'Organization',
+        'Nonprofit organization',
+        'Non-profit organization',
+    ]
+    variations = sorted({variation for variation in business_type_variations if variation}, key=lambda v: (-len(v), v))
+    return re.compile(r'\b(?:' + '|'.join(re.escape(variation) for variation in variations) + r')\b', re.IGNORECASE)
+
+@lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """
+    Resolve the ChromeDriver binary once per process instead of once per browser.
+
+    Returns:
+        str: Path to the installed ChromeDriver executable.
+    """
+    return ChromeDriverManager().install()
+
+# Place keys already written to each JSON Lines output file, loaded once per path
+_SAVED_PLACE_KEYS: Dict[str, Set[str]] = {}
+_SAVED_PLACE_KEYS_LOCK = Lock()
+
+def _place_key(entry: Dict[str, Any]) -> Optional[str]:
+    """
+    Return the key used to deduplicate saved businesses.
+
+    Args:
+        entry (Dict[str, Any]): A scraped business entry.
+
+    Returns:
+        Optional[str]: The place link, which is unique per place, or the name for entries without one.
+    """
+    return entry.get('href') or entry.get('name')
+
+def _load_saved_place_keys(json_path: str) -> Set[str]:
+    """
+    Collect the place keys of the businesses already stored in a JSON Lines file.
+
+    Args:
+        json_path (str): Path to the JSON Lines file.
+
+    Returns:
+        Set[str]: The keys found in the file; empty if the file does not exist yet.
+    """
+    keys: Set[str] = set()
+    try:
+        with open(json_path, 'rb') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    entry = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    logging.warning(f"Skipping corrupted line in {json_path}")
+                    continue
+                key = _place_key(entry)
+                if key is not None:
+                    keys.add(key)
+    except FileNotFoundError:
+        logging.info(f"JSON Lines file {json_path} not found. Starting with an empty file.")
+        return keys
+    logging.info(f"Loaded {len(keys)} existing entries from {json_path}.")
+    return keys
+
+def _fast_wait(driver: webdriver.Chrome, timeout: float = 10) -> WebDriverWait:
+    """
+    Build a WebDriverWait that polls faster than Selenium's 500 ms default.
+
+    Args:
+        driver (webdriver.Chrome): The Selenium WebDriver instance.
+        timeout (float): Maximum time to wait, in seconds.
+
+    Returns:
+        WebDriverWait: A wait that rechecks its condition every WAIT_POLL_FREQUENCY seconds.
+    """
+    return WebDriverWait(
+        driver,
+        timeout,
+        poll_frequency=WAIT_POLL_FREQUENCY,
+        ignored_exceptions=(StaleElementReferenceException,),
+    )
+
+class DomainRateLimiter:
+    """
+    A thread-safe limiter that spaces out page loads per hostname.
+
+    Attributes:
+        interval (float): Minimum number of seconds between loads on the same host.
+    """
+
+    def __init__(self, requests_per_second: float):
+        """
+        Initialize the DomainRateLimiter.
+
+        Args:
+            requests_per_second (float): Maximum page loads per second for each host.
+        """
+        self.interval = 1.0 / requests_per_second
+        self._next_slots: Dict[str, float] = {}
+        self._lock = Lock()
+
+    def wait(self, url: str) -> None:
+        """
+        Block until a page load for the URL's host is allowed.
+
+        Args:
+            url (str): The URL about to be loaded.
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slots.get(host, 0.0))
+            self._next_slots[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+# Shared by all scrapers in the process so pooled instances respect one budget
+domain_rate_limiter = DomainRateLimiter(SCRAPER_REQUESTS_PER_SECOND)
+
 # Import the field mappings from google_maps_service
 from app.services.google_maps_service import FIELD_MAPPINGS, DETAILED_SCRAPING_FIELDS
 
@@ -60,7 +287,7 @@ class GoogleMapsScraper:
         driver_pool (Queue): A pool of WebDriver instances.
         lock (Lock): A threading lock for synchronization.
         results_queue (Queue): A queue to store scraped results.
-        processed_items (Set[str]): A set to keep track of processed items.
+        processed_items (Set[str]): Place links of the result cards already processed.
         timing_log_file (str): File path for logging timing information.
         start_time (float): Start time of the scraping process.
     """
@@ -81,6 +308,8 @@ class GoogleMapsScraper:
         self.processed_items: Set[str] = set()
         self.timing_log_file = "scraper_timing.txt"
         self.start_time = time.time()
+        # Dedicated workers for detail page scrapes, one per pooled driver
+        self.detail_executor = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="gmaps-detail")
         self._initialize_driver_pool()
 
     def _initialize_driver_pool(self) -> None:
@@ -101,12 +330,44 @@ class GoogleMapsScraper:
         """
         chrome_options = ChromeOptions()
         if headless:
-            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--autoplay-policy=user-gesture-required")
+        # A tall viewport renders more result cards per scroll
+        chrome_options.add_argument(f"--window-size={CHROME_WINDOW_SIZE}")
+        # Images are never read by the scraper; skip downloading and decoding them
+        chrome_options.add_experimental_option("prefs", CHROME_CONTENT_PREFS)
         chrome_options.binary_location = "/usr/bin/google-chrome-stable"
-        service = ChromeService(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=chrome_options)
+        # Discard chromedriver's log instead of piping it into this long-lived process
+        service = ChromeService(_chromedriver_path(), log_output=os.devnull)
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        try:
+            # Web fonts have no Chrome content setting; block them at the network layer instead.
+            # Stylesheets stay enabled because the results feed needs layout to scroll.
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception:
+            self._quit_driver(driver)
+            raise
+        return driver
+
+    @staticmethod
+    def _quit_driver(driver: webdriver.Chrome) -> None:
+        """
+        Quit a WebDriver and its chromedriver process, logging instead of raising on failure.
+
+        Args:
+            driver (webdriver.Chrome): The WebDriver instance to shut down.
+        """
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"Error quitting WebDriver: {e}")
+            try:
+                driver.service.stop()
+            except Exception:
+                pass
 
     @staticmethod
     def generate_search_url(search_query: str) -> str:
@@ -136,7 +397,7 @@ class GoogleMapsScraper:
             Optional[Any]: The found element or None if not found.
         """
         try:
-            return WebDriverWait(driver, timeout).until(
+            return _fast_wait(driver, timeout).until(
                 EC.presence_of_element_located((by, selector))
             )
         except TimeoutException:
@@ -151,25 +412,23 @@ class GoogleMapsScraper:
             driver (webdriver.Chrome): The Selenium WebDriver instance.
         """
         popup_buttons = [
-            (By.XPATH, "//button[contains(@aria-label, 'Accept')]"),
+            (By.CSS_SELECTOR, "button[aria-label*='Accept']"),
             (By.XPATH, "//button[contains(text(), 'Accept')]"),
-            (By.XPATH, "//button[contains(@aria-label, 'Agree')]"),
+            (By.CSS_SELECTOR, "button[aria-label*='Agree']"),
             (By.XPATH, "//button[contains(text(), 'Agree')]"),
-            (By.XPATH, "//button[contains(@aria-label, 'OK')]"),
+            (By.CSS_SELECTOR, "button[aria-label*='OK']"),
             (By.XPATH, "//button[contains(text(), 'OK')]"),
             (By.ID, "L2AGLb"),  # Google's "I agree" button ID
         ]
 
         for by, selector in popup_buttons:
             try:
-                button = WebDriverWait(driver, 2).until(
+                button = _fast_wait(driver, 2).until(
                     EC.element_to_be_clickable((by, selector))
                 )
                 button.click()
                 logging.info(f"Clicked popup button: {selector}")
-                WebDriverWait(driver, 2).until(
-                    EC.invisibility_of_element_located((by, selector))
-                )
+                _fast_wait(driver, 2).until(EC.staleness_of(button))
                 return
             except TimeoutException:
                 continue
@@ -179,32 +438,38 @@ class GoogleMapsScraper:
     @staticmethod
     def save_results_to_json(results: List[Dict[str, Any]], json_path: str) -> None:
         """
-        Save results to a JSON file, avoiding duplicates.
+        Append results to a JSON Lines file (one business per line), avoiding duplicates.
+
+        Entries are keyed by place link, since names repeat across chain locations. The keys
+        already in the file are read once per path and kept in memory, so each call only
+        writes the new entries instead of rewriting the whole file.
 
         Args:
             results (List[Dict[str, Any]]): List of new business entries to save.
-            json_path (str): Path to the JSON file.
+            json_path (str): Path to the JSON Lines file.
         """
-        try:
-            with open(json_path, 'r', encoding='utf-8') as file:
-                existing_data = json.load(file)
-                logging.info(f"Loaded {len(existing_data)} existing entries from {json_path}.")
-        except (FileNotFoundError, json.JSONDecodeError):
-            logging.warning(f"JSON file {json_path} not found or corrupted. Starting with an empty list.")
-            existing_data = []
-
-        existing_names = {entry['name'] for entry in existing_data if 'name' in entry}
-        new_entries = [entry for entry in results if entry.get('name') not in existing_names]
-        logging.info(f"New entries to add: {len(new_entries)}")
-
-        if new_entries:
-            existing_data.extend(new_entries)
-            try:
-                with open(json_path, 'w', encoding='utf-8') as file:
-                    json.dump(existing_data, file, indent=4, ensure_ascii=False)
-                logging.info(f"Saved {len(new_entries)} new entries to {json_path}")
-            except Exception as e:
-                logging.error(f"Error saving to JSON file: {e}")
+        with _SAVED_PLACE_KEYS_LOCK:
+            existing_keys = _SAVED_PLACE_KEYS.get(json_path)
+            if existing_keys is None:
+                existing_keys = _SAVED_PLACE_KEYS[json_path] = _load_saved_place_keys(json_path)
+
+            new_lines = []
+            for entry in results:
+                key = _place_key(entry)
+                if key in existing_keys:
+                    continue
+                if key is not None:
+                    existing_keys.add(key)
+                new_lines.append(orjson.dumps(entry) + b'\n')
+            logging.info(f"New entries to add: {len(new_lines)}")
+
+            if new_lines:
+                try:
+                    with open(json_path, 'ab') as file:
+                        file.writelines(new_lines)
+                    logging.info(f"Saved {len(new_lines)} new entries to {json_path}")
+                except Exception as e:
+                    logging.error(f"Error saving to JSON Lines file: {e}")
 
     @staticmethod
     def _clean_address(address: str, business_type: Optional[str]) -> str:
@@ -218,41 +483,18 @@ class GoogleMapsScraper:
         Returns:
             str: The cleaned address.
         """
-        address = re.sub(r'\d{1,2}(?::\d{2})?\s*[AaPp][Mm]', '', address)
-        address = re.sub(
-            r'\b(Mon|Tue|Wed|Thu|Fri|Sat|Sun|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\b',
-            '',
-            address,
-            flags=re.IGNORECASE,
-        )
-        address = re.sub(
-            r'\b(Open|Closed|Opens|Closes)\b', '', address, flags=re.IGNORECASE
-        )
-        address = re.sub(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', '', address)
+        address = ADDRESS_NOISE_PATTERN.sub('', address)
         address = address.replace('24 hours', '')
 
         if business_type:
-            business_type_variations = [
-                business_type.lower(),
-                business_type.replace(' ', ''),
-                business_type.replace('/', ' '),
-                business_type.replace('&', 'and'),
-                business_type.replace('and', '&'),
-                'Association',
-                'Organization',
-                'Nonprofit organization',
-                'Non-profit organization',
-            ]
-            for variation in business_type_variations:
-                address = re.sub(r'\b' + re.escape(variation) + r'\b', '', address, flags=re.IGNORECASE)
-
-        address = re.sub(r'\s+', ' ', address)
-        address = re.sub(r'[^\w\s]', '', address)
-
-        address_pattern = r'\d+\s+[A-Za-z0-9\s]+'
-        matches = re.findall(address_pattern, address)
-        if matches:
-            return matches[0].strip()
+            address = _business_type_pattern(business_type).sub('', address)
+
+        address = WHITESPACE_PATTERN.sub(' ', address)
+        address = PUNCTUATION_PATTERN.sub('', address)
+
+        match = STREET_ADDRESS_PATTERN.search(address)
+        if match:
+            return match.group().strip()
 
         return address.strip()
 
@@ -308,7 +550,7 @@ class GoogleMapsScraper:
 
             # Hours
             try:
-                hours_button = WebDriverWait(driver, 10).until(
+                hours_button = _fast_wait(driver, 10).until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, 'div[data-hide-tooltip-on-mouse-move="true"]'))
                 )
                 hours_button.click()
@@ -367,8 +609,8 @@ class GoogleMapsScraper:
             try:
                 similar_businesses_section = self._wait_for_element(driver, By.CSS_SELECTOR, "div.fp2VUc", timeout=10)
                 if similar_businesses_section:
-                    self.driver.execute_script("arguments[0].scrollIntoView();", similar_businesses_section)
-                    WebDriverWait(self.driver, 2).until(EC.visibility_of(similar_businesses_section))
+                    driver.execute_script("arguments[0].scrollIntoView();", similar_businesses_section)
+                    _fast_wait(driver, 2).until(EC.visibility_of(similar_businesses_section))
                     details['similar_businesses'] = self._scrape_similar_businesses(driver)
                 else:
                     details['similar_businesses'] = []
@@ -378,10 +620,10 @@ class GoogleMapsScraper:
 
             # About section
             try:
-                about_tab = self._wait_for_element(driver, By.XPATH, "//button[@role='tab' and contains(@aria-label, 'About')]", timeout=10)
+                about_tab = self._wait_for_element(driver, By.CSS_SELECTOR, "button[role='tab'][aria-label*='About']", timeout=10)
                 if about_tab:
                     about_tab.click()
-                    WebDriverWait(driver, 2).until(
+                    _fast_wait(driver, 2).until(
                         EC.presence_of_element_located((By.CSS_SELECTOR, "div.iP2t7d.fontBodyMedium"))
                     )
                     details['about'] = self._scrape_about_section(driver)
@@ -442,9 +684,11 @@ class GoogleMapsScraper:
                     rating_element = card.find_elements(By.CSS_SELECTOR, "span.ZkP5Je")
                     if rating_element:
                         rating_text = rating_element[0].get_attribute("aria-label")
-                        rating = float(re.search(r"(\d+(\.\d+)?)", rating_text).group(1)) if re.search(r"(\d+(\.\d+)?)", rating_text) else None
+                        rating_match = RATING_PATTERN.search(rating_text)
+                        rating = float(rating_match.group(1)) if rating_match else None
 
-                        reviews_count = int(re.search(r"(\d+)", rating_text).group(1)) if re.search(r"(\d+)", rating_text) else None
+                        reviews_count_match = REVIEW_COUNT_PATTERN.search(rating_text)
+                        reviews_count = int(reviews_count_match.group(1)) if reviews_count_match else None
                     else:
                         no_review_element = card.find_elements(By.CSS_SELECTOR, "span.Q5g20.e4rVHe.fontBodyMedium")
                         if no_review_element and no_review_element[0].text.lower() == "no reviews":
@@ -457,7 +701,7 @@ class GoogleMapsScraper:
                     business_type = card.find_element(By.CSS_SELECTOR, "div.Q5g20").text
 
                     aria_label = card.get_attribute("aria-label")
-                    place_id_match = re.search(r"ChIJ\w+", aria_label)
+                    place_id_match = PLACE_ID_PATTERN.search(aria_label)
                     href = f"https://www.google.com/maps/place/?q=place_id:{place_id_match.group()}" if place_id_match else None
 
                     try:
@@ -497,30 +741,35 @@ class GoogleMapsScraper:
             List[Dict[str, Any]]: A list of reviews.
         """
         reviews = []
+        seen_review_ids: Set[str] = set()
+        processed_count = 0
         try:
             reviews_container = self._wait_for_element(driver, By.CSS_SELECTOR, '.dS8AEf', timeout=10)
             if not reviews_container:
                 logging.warning("Reviews container not found")
                 return reviews
 
-            last_height = driver.execute_script("return arguments[0].scrollHeight", reviews_container)
+            def more_reviews_loaded(d):
+                # Resolves to the review elements once more have loaded than were already handled
+                found = d.find_elements(By.CSS_SELECTOR, "div.jftiEf")
+                return found if len(found) > processed_count else False
+
             while len(reviews) < max_reviews:
                 driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", reviews_container)
-                WebDriverWait(driver, 2).until(
-                    lambda d: driver.execute_script("return arguments[0].scrollHeight", reviews_container) > last_height
-                )
-                new_height = driver.execute_script("return arguments[0].scrollHeight", reviews_container)
-                if new_height == last_height:
-                    break
-                last_height = new_height
+                try:
+                    review_elements = _fast_wait(driver, 2).until(more_reviews_loaded)
+                except TimeoutException:
+                    break  # No further reviews loaded
 
-                review_elements = driver.find_elements(By.CSS_SELECTOR, "div.jftiEf")
-                for review in review_elements:
+                # Only visit reviews loaded since the previous scroll
+                for review in review_elements[processed_count:]:
                     if len(reviews) >= max_reviews:
                         break
                     review_data = self._extract_review_data(review)
-                    if review_data and review_data['id'] not in {r['id'] for r in reviews}:
+                    if review_data and review_data['id'] not in seen_review_ids:
+                        seen_review_ids.add(review_data['id'])
                         reviews.append(review_data)
+                processed_count = len(review_elements)
 
         except TimeoutException:
             logging.error("Timeout during review scraping")
@@ -594,7 +843,7 @@ class GoogleMapsScraper:
             try:
                 image_element = review.find_element(By.CSS_SELECTOR, "button.Tya61d")
                 image_style = image_element.get_attribute('style')
-                image = re.search(r'url\("(.+?)"\)', image_style).group(1) if image_style else None
+                image = BACKGROUND_IMAGE_PATTERN.search(image_style).group(1) if image_style else None
             except (NoSuchElementException, AttributeError):
                 image = None
 
@@ -646,7 +895,7 @@ class GoogleMapsScraper:
         Returns:
             Optional[int]: The extracted number or None if not found.
         """
-        match = re.search(rf'(\d+)\s*{keyword}', text.lower())
+        match = _keyword_number_pattern(keyword).search(text.lower())
         return int(match.group(1)) if match else None
 
     @staticmethod
@@ -664,7 +913,7 @@ class GoogleMapsScraper:
         if not date_text:
             return now.isoformat()
 
-        match = re.search(r'(\d+)\s*(year|month|week|day|hour|minute)s?', date_text.lower())
+        match = RELATIVE_DATE_PATTERN.search(date_text.lower())
         if not match:
             return now.isoformat()
 
@@ -688,26 +937,33 @@ class GoogleMapsScraper:
 
         return date.isoformat()
 
-    def _process_item(self, item: Any) -> None:
+    def _process_item(self, card: Dict[str, Any]) -> None:
+        """
+        Turn the raw fields of one result card into a lead entry and queue it.
+
+        Args:
+            card (Dict[str, Any]): Card fields as returned by CARD_EXTRACTION_SCRIPT.
+        """
         try:
-            # Extract name and href first
-            name_element = item.find_element(By.CSS_SELECTOR, "div.qBF1Pd")
-            name = name_element.text.strip()
-            href_element = item.find_element(By.CSS_SELECTOR, "a.hfpxzc")
-            href = href_element.get_attribute('href')
-
-            # Check if this item has already been processed
-            if name in self.processed_items:
+            name = (card.get('name') or '').strip()
+            href = card.get('href')
+            if not name or not href:
+                logging.warning("Skipping result card without a name or link")
+                return
+
+            # Check if this item has already been processed; names repeat across chain locations, place links don't
+            if href in self.processed_items:
                 logging.info(f"Skipping duplicate entry: {name}")
                 return
 
-            # Add the name to the set of processed items
-            self.processed_items.add(name)
+            # Add the place link to the set of processed items
+            self.processed_items.add(href)
 
             # Initialize result with all fields from GoogleMapsLead model
             result = {
                 'id': '',  # Will be set later by hash function
                 'name': name,
+                'href': href,  # Place page, used for detailed scraping
                 'business_phone': None,
                 'formatted_address': None,
                 'website': None,
@@ -724,34 +980,16 @@ class GoogleMapsScraper:
                 'about': None
             }
 
-            # Extract latitude and longitude from href
-            parsed_url = urlparse(href)
-            query_params = parse_qs(parsed_url.query)
-            
-            if 'data' in query_params:
-                data_param = query_params['data'][0]
-                coords_match = re.search(r'!3d(-?\d+\.\d+)!4d(-?\d+\.\d+)', data_param)
-                if coords_match:
-                    result['latitude'] = float(coords_match.group(1))
-                    result['longitude'] = float(coords_match.group(2))
-            else:
-                # If 'data' is not in query params, try to extract from the path
-                path_parts = parsed_url.path.split('/')
-                if len(path_parts) > 2 and '@' in path_parts[2]:
-                    coords = path_parts[2].split('@')[1].split(',')
-                    if len(coords) >= 2:
-                        try:
-                            result['latitude'] = float(coords[0])
-                            result['longitude'] = float(coords[1])
-                        except ValueError:
-                            logging.warning(f"Could not parse coordinates from path: {coords}")
-
-            # Extract all W4Efsd elements
-            w4efsd_elements = item.find_elements(By.CSS_SELECTOR, "div.W4Efsd")
+            # Extract latitude and longitude from href; the data segment lives in the path, not the query
+            # If there is no data segment, fall back to the '@lat,lng' path part
+            coords_match = (COORDS_PATTERN.search(href) or AT_COORDS_PATTERN.search(href)) if href else None
+            if coords_match:
+                result['latitude'] = float(coords_match.group(1))
+                result['longitude'] = float(coords_match.group(2))
 
             info_parts = []
-            for element in w4efsd_elements:
-                text = element.text.strip()
+            for text in card.get('texts') or []:
+                text = text.strip()
 
                 # Check if it's the rating element
                 if '(' in text and ')' in text and text[0].isdigit():
@@ -770,7 +1008,7 @@ class GoogleMapsScraper:
 
             # Process info_parts to extract business type, address, and phone
             for part in info_parts:
-                if re.match(r'^\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}$', part):
+                if PHONE_NUMBER_PATTERN.match(part):
                     result['business_phone'] = part
                 elif any(char.isdigit() for char in part):
                     if not result['formatted_address']:
@@ -797,12 +1035,8 @@ class GoogleMapsScraper:
             if result['formatted_address']:
                 result['formatted_address'] = self._clean_address(result['formatted_address'], result['types'][0] if result['types'] else None)
 
-            # Extract website if available
-            try:
-                website_button = item.find_element(By.CSS_SELECTOR, "a.lcr4fd[data-value='Website']")
-                result['website'] = website_button.get_attribute('href')
-            except NoSuchElementException:
-                pass
+            # Website link, if the card has one
+            result['website'] = card.get('website')
 
             # Ensure no field is set to "No reviews"
             for key in result:
@@ -812,7 +1046,7 @@ class GoogleMapsScraper:
             with self.lock:
                 self.results_queue.put(result)
                 logging.info(f"Scraped basic info for business: {result['name']}")
-        except (NoSuchElementException, StaleElementReferenceException) as e:
+        except Exception as e:
             logging.error(f"Error processing entry: {e}")
             logging.debug(traceback.format_exc())
 
@@ -829,6 +1063,7 @@ class GoogleMapsScraper:
         """
         driver = self.driver_pool.get()
         try:
+            domain_rate_limiter.wait(url)
             driver.get(url)
             logging.info(f"Navigating to {url}")
 
@@ -836,31 +1071,29 @@ class GoogleMapsScraper:
 
             results: List[Dict[str, Any]] = []
             scroll_count = 0
-            last_height = 0
             last_processed_index = 0
             no_new_items_count = 0
 
             try:
-                results_container = WebDriverWait(driver, 20).until(
+                results_container = _fast_wait(driver, 20).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "div[role='feed']"))
                 )
             except TimeoutException:
-                logging.error("Couldn't find results container. Page source:")
-                logging.error(driver.page_source)
+                page_source = driver.page_source
+                logging.error(f"Couldn't find results container. Page source (first {PAGE_SOURCE_LOG_LIMIT} of {len(page_source)} chars):")
+                logging.error(page_source[:PAGE_SOURCE_LOG_LIMIT])
                 return results
 
             while scroll_count < max_scrolls:
-                items = driver.find_elements(By.CSS_SELECTOR, "div.Nv2PK")
-                new_items = len(items) - last_processed_index
+                # One round-trip returns the fields of every card added since the last scroll
+                cards = driver.execute_script(CARD_EXTRACTION_SCRIPT, last_processed_index)
+                new_items = len(cards)
 
                 if new_items > 0:
-                    logging.info(f"Found {len(items)} items, {new_items} new")
-                    for item in items[last_processed_index:]:
-                        try:
-                            await self._process_item_async(item)
-                        except (NoSuchElementException, StaleElementReferenceException) as e:
-                            logging.error(f"Error processing item: {e}")
-                    last_processed_index = len(items)
+                    logging.info(f"Found {last_processed_index + new_items} items, {new_items} new")
+                    for card in cards:
+                        self._process_item(card)
+                    last_processed_index += new_items
                     no_new_items_count = 0
                 else:
                     logging.info("No new items found in this scroll")
@@ -870,15 +1103,18 @@ class GoogleMapsScraper:
                         break
 
                 driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", results_container)
-                scroll_count += 1            
-                await asyncio.sleep(1)  # Use asyncio.sleep for non-blocking delay
-                
-                new_height = driver.execute_script("return arguments[0].scrollHeight", results_container)
-                if new_height == last_height:
-                    logging.info("Scroll height didn't change, may have reached the end")
+                scroll_count += 1
+
+                # Wait for more cards to render (or the end marker) instead of a fixed sleep
+                try:
+                    await asyncio.to_thread(
+                        _fast_wait(driver, SCROLL_LOAD_TIMEOUT).until,
+                        lambda d: d.execute_script(FEED_LOADED_SCRIPT, last_processed_index),
+                    )
+                except TimeoutException:
+                    logging.info("No more results loaded after scrolling, may have reached the end")
                     break
-                last_height = new_height
-                
+
                 logging.info(f"Scrolled {scroll_count} times, collected {self.results_queue.qsize()} results so far")
 
                 try:
@@ -895,22 +1131,20 @@ class GoogleMapsScraper:
 
             logging.info(f"Fast scraping completed. Found {len(results)} unique entries after {scroll_count} scrolls.")
             
-            # Now perform detailed scraping using multithreading
-            detailed_results = await self._scrape_businesses_details_async(results)
-            
-            return detailed_results
+            return results
         finally:
             self.driver_pool.put(driver)
 
-    async def _process_item_async(self, item: Any) -> None:
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._process_item, item)
-
     async def _scrape_businesses_details_async(self, businesses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        detailed_results = []
+        # One in-flight detail scrape per pooled driver; the rest wait here instead of blocking executor threads
+        semaphore = asyncio.Semaphore(self.max_threads)
         
         async def scrape_single_business_async(business):
-            details = await self._scrape_single_business_async(business['href'])
+            href = business.get('href')
+            if not href:
+                return business
+            async with semaphore:
+                details = await self._scrape_single_business_async(href)
             business.update(details)
             return business
 
@@ -921,22 +1155,21 @@ class GoogleMapsScraper:
 
     async def _scrape_single_business_async(self, href: str) -> Dict[str, Any]:
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._scrape_single_business, href)
+        return await loop.run_in_executor(self.detail_executor, self._scrape_single_business, href)
 
     def _scrape_single_business(self, href: str) -> Dict[str, Any]:
         details = {}
-        max_retries = 3
-        retry_delay = 2  # seconds
 
-        for attempt in range(max_retries):
+        for attempt in range(DETAIL_MAX_RETRIES):
             driver = self.driver_pool.get()
             start_time = time.time()
             try:
+                domain_rate_limiter.wait(href)
                 driver.get(href)
                 logging.info(f"Scraping single business from {href}")
                 #self._handle_popups(driver)
                 details = self.scrape_business_details(driver)
-                logging.info(f"Scraped details: {details}")
+                logging.debug("Scraped details: %s", details)
                 return details
             except WebDriverException as e:
                 logging.warning(f"WebDriver error on attempt {attempt + 1}: {e}")
@@ -947,11 +1180,13 @@ class GoogleMapsScraper:
                 self.driver_pool.put(driver)
                 duration = time.time() - start_time
                 self.log_timing(f"WebDriver usage for {href}", duration)
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
 
-        logging.error(f"Failed to scrape business after {max_retries} attempts: {href}")
+            # Only reached on failure; back off with jitter so parallel workers don't retry in lockstep
+            if attempt < DETAIL_MAX_RETRIES - 1:
+                backoff = min(DETAIL_RETRY_BACKOFF_INITIAL * (2 ** attempt), DETAIL_RETRY_BACKOFF_MAX)
+                time.sleep(random.uniform(0, backoff))
+
+        logging.error(f"Failed to scrape business after {DETAIL_MAX_RETRIES} attempts: {href}")
         return details
 
     def log_timing(self, operation, duration):
@@ -963,13 +1198,50 @@ class GoogleMapsScraper:
         overall_duration = time.time() - self.start_time
         self.log_timing("Overall scraping process", overall_duration)
 
+    def ensure_healthy(self) -> int:
+        """
+        Replace pooled WebDriver instances whose browser no longer responds.
+
+        Returns:
+            int: Number of drivers that were replaced.
+        """
+        replaced = 0
+        for _ in range(self.driver_pool.qsize()):
+            driver = self.driver_pool.get()
+            try:
+                driver.current_url  # Cheap round-trip to the browser
+            except WebDriverException:
+                logging.warning("Replacing unresponsive WebDriver")
+                self._quit_driver(driver)
+                driver = self._setup_selenium(headless=self.headless)
+                replaced += 1
+            self.driver_pool.put(driver)
+        return replaced
+
+    def reset(self) -> None:
+        """
+        Clear per-run state so the scraper can be reused for another search.
+        """
+        with self.lock:
+            self.processed_items.clear()
+            while not self.results_queue.empty():
+                self.results_queue.get_nowait()
+        # Start the next search from a clean session without paying for a browser restart
+        for driver in list(self.driver_pool.queue):
+            try:
+                driver.delete_all_cookies()
+            except WebDriverException as e:
+                logging.warning(f"Could not clear cookies of pooled WebDriver: {e}")
+        self.start_time = time.time()
+
     def close(self):
         """
         Close all WebDriver instances in the pool.
         """
+        self.detail_executor.shutdown(wait=True)
         while not self.driver_pool.empty():
-            driver = self.driver_pool.get()
-            driver.quit()
+            # One failing browser must not leave the rest of the pool running
+            self._quit_driver(self.driver_pool.get())
         logging.info("All WebDrivers closed.")
 
     async def scrape(self, url: str, fields: Optional[List[str]] = None, max_scrolls: int = 100) -> List[Dict[str, Any]]:
@@ -1022,10 +1294,11 @@ async def main_async():
     """Main asynchronous function to run the scraper. This is used for testing purposes."""
     # User inputs
     search_query = "personal care manufacturers near denver"  # Example search query
-    json_path = 'GoogleMapsDataFast.json'
+    json_path = 'GoogleMapsDataFast.jsonl'
     fields = ["name", "rating", "address", "phone", "website"]  # Example fields
 
-    scraper = GoogleMapsScraper(headless=True, max_threads=4)
+    # Set HEADLESS=0 to watch the browser while debugging
+    scraper = GoogleMapsScraper(headless=os.getenv("HEADLESS", "1") == "1", max_threads=4)
 
     try:
         # Generate the search URL
@@ -1050,4 +1323,9 @@ async def main_async():
         scraper.close()
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler()],
+    )
     asyncio.run(main_async())
@@ -5,19 +5,21 @@ This module provides functionality to fetch business leads from Google Maps API.
 It includes methods for searching areas, making API requests, and handling rate limiting.
 """
 
+import asyncio
 import logging
 import math
+import random
 import time
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, wait
-import requests
-import numpy as np
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional, Tuple
+import httpx
 
+from app.models.google_maps_lead import GoogleMapsLeadDict
 from app.utils.config import GOOGLE_MAPS_API_KEY
 from app.utils.location_utils import get_bounding_box, haversine_distance
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -177,6 +179,10 @@ DETAILED_SCRAPING_FIELDS = {
     "images", "reviews", "similar_businesses", "about", "additional_properties"
 }
 
+# Flattened per-field lookups for the Place Details path, built once at import time
+_DETAILS_API_FIELDS = {field: mapping["api"]["details"] for field, mapping in FIELD_MAPPINGS.items()}
+_RESPONSE_KEYS = {field: mapping["response"] for field, mapping in FIELD_MAPPINGS.items()}
+
 # Fields available in the API
 API_VALID_FIELDS = {
     field for field, mapping in FIELD_MAPPINGS.items() 
@@ -188,6 +194,22 @@ MAX_RADIUS = 50000  # Maximum radius allowed by the API
 MIN_RADIUS = 100  # Minimum radius to avoid too many small searches
 MAX_REQUESTS_PER_MINUTE = 590  # Setting it slightly below 600 for safety
 COST_PER_REQUEST = 0.032  # $0.032 per request as of 2023
+HTTP_TIMEOUT = 30.0  # seconds
+MAX_CONCURRENT_DETAILS = 10
+MAX_CONCURRENT_SEARCHES = 16  # Nearby Search requests in flight per work-queue batch
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60.0)
+HTTP_CONNECT_RETRIES = 3  # transport-level retries for failed connection attempts
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_API_RETRIES = 3
+RETRY_BACKOFF_INITIAL = 0.5  # seconds
+RETRY_BACKOFF_MAX = 10.0  # seconds
+REGION_CONTAINMENT_FACTOR = 0.95  # a query is redundant if it lies within this fraction of a completed region
+METERS_PER_DEGREE = 6374000.0 * math.pi / 180  # meters per degree of latitude
+SUBCIRCLE_RADIUS_RATIO = 0.72791  # three circles of this relative radius cover the parent circle
+# Unit offsets of the three subcircle centers, 120 degrees apart
+_SUBCIRCLE_DIRECTIONS = tuple(
+    (math.cos(angle), math.sin(angle)) for angle in (0.0, 2 * math.pi / 3, 4 * math.pi / 3)
+)
 
 # Constants for pricing (prices are in USD)
 BASIC_DATA_COST = 0.00
@@ -196,9 +218,73 @@ ATMOSPHERE_DATA_COST = 0.005
 NEARBY_SEARCH_COST = 0.032
 PLACE_DETAILS_COST = 0.017
 
+PLACE_DETAILS_CACHE_SIZE = 10000
+PLACE_DETAILS_CACHE_TTL = 24 * 60 * 60  # seconds
+FIELD_MAP_CACHE_SIZE = 128
+
 # Global variables
 API_REQUEST_COUNT = 0
-request_timestamps = []
+
+# Process-wide place details cache: (place_id, sorted fields) -> (stored_at, mapped details)
+_place_details_cache: "OrderedDict[Tuple[str, Tuple[str, ...]], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+class RequestRateLimiter:
+    """
+    Spaces out requests so that at most ``max_requests`` start per ``period`` seconds.
+
+    Attributes:
+        interval (float): Minimum number of seconds between request starts.
+    """
+
+    def __init__(self, max_requests: int, period: float = 60.0):
+        """
+        Initialize the RequestRateLimiter.
+
+        Args:
+            max_requests (int): Maximum number of requests per period.
+            period (float): Length of the period in seconds.
+        """
+        self.interval = period / max_requests
+        self._next_slot = 0.0
+
+    async def acquire(self, *_: Any) -> None:
+        """
+        Wait for the next request slot. Usable directly as an httpx request event hook.
+        """
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+# Process-wide limiter for Places API calls, shared by all clients
+places_rate_limiter = RequestRateLimiter(MAX_REQUESTS_PER_MINUTE)
+
+async def send_with_retry(client: httpx.AsyncClient, method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """
+    Send a request, retrying rate-limited and server error responses with jittered exponential backoff.
+
+    Args:
+        client (httpx.AsyncClient): The HTTP client to send with.
+        method (str): HTTP method.
+        url (str): Request URL.
+        **kwargs: Extra arguments passed to ``client.request``.
+
+    Returns:
+        httpx.Response: The final response, which may still be an error after the last retry.
+    """
+    for attempt in range(MAX_API_RETRIES + 1):
+        response = await client.request(method, url, **kwargs)
+        if response.status_code not in RETRYABLE_STATUS_CODES or attempt == MAX_API_RETRIES:
+            return response
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = min(float(retry_after), RETRY_BACKOFF_MAX)
+        else:
+            delay = min(RETRY_BACKOFF_INITIAL * (2 ** attempt) + random.uniform(0, RETRY_BACKOFF_INITIAL), RETRY_BACKOFF_MAX)
+        logger.warning(f"Places API returned {response.status_code}, retrying in {delay:.2f}s (attempt {attempt + 1}/{MAX_API_RETRIES})")
+        await asyncio.sleep(delay)
+    return response
 
 def three_circle_tiling(lon: float, lat: float, radius: float) -> List[tuple]:
     """
@@ -212,52 +298,118 @@ def three_circle_tiling(lon: float, lat: float, radius: float) -> List[tuple]:
     Returns:
         List[tuple]: List of tuples containing (longitude, latitude, radius) for each subcircle.
     """
-    subcircles = []
-    for rad in np.linspace(0, 2 * np.pi, 3, endpoint=False):
-        km_per_lon = 6374. * 1000 * (2*np.pi/360) * np.cos(np.radians(lat))
-        km_per_lat = 6374. * 1000 * (2*np.pi/360)
-        radius_subcircle = radius * 0.72791
-        lon_subcircle = lon + (radius*0.72791) * np.cos(rad) / km_per_lon
-        lat_subcircle = lat + (radius*0.72791) * np.sin(rad) / km_per_lat
-        subcircles.append((lon_subcircle, lat_subcircle, radius_subcircle))
-    return subcircles
-
-def get_place_details(place_id: str, fields: List[str]) -> Dict[str, Any]:
-    """Get detailed information about a place using the Places API v1."""
+    meters_per_lon = METERS_PER_DEGREE * math.cos(math.radians(lat))
+    radius_subcircle = radius * SUBCIRCLE_RADIUS_RATIO
+    return [
+        (lon + radius_subcircle * cos_angle / meters_per_lon,
+         lat + radius_subcircle * sin_angle / METERS_PER_DEGREE,
+         radius_subcircle)
+        for cos_angle, sin_angle in _SUBCIRCLE_DIRECTIONS
+    ]
+
+@lru_cache(maxsize=FIELD_MAP_CACHE_SIZE)
+def _details_field_map(fields_key: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Resolve a set of requested fields to Place Details API keys and response keys.
+
+    Args:
+        fields_key (Tuple[str, ...]): The sorted requested fields.
+
+    Returns:
+        Tuple[Tuple[str, str], ...]: (details API key, response key) pairs for the known fields.
+    """
+    return tuple(
+        (_DETAILS_API_FIELDS[field], _RESPONSE_KEYS[field])
+        for field in fields_key if field in _DETAILS_API_FIELDS
+    )
+
+def _get_cached_place_details(key: Tuple[str, Tuple[str, ...]]) -> Optional[Dict[str, Any]]:
+    """
+    Look up fresh place details in the in-process cache.
+
+    Args:
+        key (Tuple[str, Tuple[str, ...]]): The place ID and its sorted requested fields.
+
+    Returns:
+        Optional[Dict[str, Any]]: A copy of the cached details, or None on a miss or expired entry.
+    """
+    entry = _place_details_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, details = entry
+    if time.monotonic() - stored_at > PLACE_DETAILS_CACHE_TTL:
+        del _place_details_cache[key]
+        return None
+    _place_details_cache.move_to_end(key)
+    return dict(details)
+
+def _cache_place_details(key: Tuple[str, Tuple[str, ...]], details: Dict[str, Any]) -> None:
+    """
+    Store place details in the in-process cache, evicting the least recently used entry when full.
+
+    Args:
+        key (Tuple[str, Tuple[str, ...]]): The place ID and its sorted requested fields.
+        details (Dict[str, Any]): The mapped place details.
+    """
+    _place_details_cache[key] = (time.monotonic(), details)
+    _place_details_cache.move_to_end(key)
+    if len(_place_details_cache) > PLACE_DETAILS_CACHE_SIZE:
+        _place_details_cache.popitem(last=False)
+
+async def get_place_details(client: httpx.AsyncClient, place_id: str, fields: List[str],
+                            api_calls: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    """
+    Get detailed information about a place using the Places API v1.
+
+    Results are cached in-process per place and field set, so repeated leads skip the billed call.
+
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client for API requests.
+        place_id (str): The place to look up.
+        fields (List[str]): Fields to request.
+        api_calls (Optional[Dict[str, int]]): Counters updated with billed calls and cache hits.
+
+    Returns:
+        Dict[str, Any]: The requested details mapped to response keys, or an empty dict on failure.
+    """
+    fields_key = tuple(sorted(fields))
+    cache_key = (place_id, fields_key)
+    cached = _get_cached_place_details(cache_key)
+    if cached is not None:
+        if api_calls is not None:
+            api_calls['place_details_cache_hits'] = api_calls.get('place_details_cache_hits', 0) + 1
+        return cached
+
     try:
-        api_fields = []
-        for field in fields:
-            if field in FIELD_MAPPINGS:
-                api_fields.append(FIELD_MAPPINGS[field]["api"]["details"])
+        field_map = _details_field_map(fields_key)
         
-        if not api_fields:
+        if not field_map:
             logger.warning(f"No valid API fields found for requested fields: {fields}")
             return {}
             
-        headers = {
-            "X-Goog-Api-Key": GOOGLE_MAPS_API_KEY,
-            "X-Goog-FieldMask": ",".join(api_fields)
-        }
+        headers = {"X-Goog-FieldMask": ",".join(api_field for api_field, _ in field_map)}
         
         url = f"{BASE_URL_PLACE_DETAILS}{place_id}"
         
-        response = requests.get(url, headers=headers)
+        if api_calls is not None:
+            api_calls['place_details'] = api_calls.get('place_details', 0) + 1
+        response = await send_with_retry(client, "GET", url, headers=headers)
         response.raise_for_status()
         result = response.json()
         
         # Map the response back to our standard format
         mapped_result = {}
-        for field in fields:
-            if field in FIELD_MAPPINGS:
-                api_field = FIELD_MAPPINGS[field]["api"]["details"]
-                value = result.get(api_field)
-                if value:
-                    if api_field == "displayName":
-                        value = value.get("text", "")
-                    mapped_result[FIELD_MAPPINGS[field]["response"]] = value
+        for api_field, response_key in field_map:
+            value = result.get(api_field)
+            if value:
+                if api_field == "displayName":
+                    value = value.get("text", "")
+                mapped_result[response_key] = value
         
         if not mapped_result:
             logger.warning(f"No data mapped for place_id {place_id} with fields {fields}")
+        else:
+            _cache_place_details(cache_key, dict(mapped_result))
             
         return mapped_result
     except Exception as e:
@@ -268,8 +420,9 @@ def requires_scraper(fields: List[str]) -> bool:
     """Check if any of the requested fields require using the scraper"""
     return bool(set(fields) & SCRAPER_ONLY_FIELDS)
 
-def make_api_request(business_types: List[str], lat: float, lon: float, radius: float, fields: Optional[List[str]] = None) -> Dict[str, Any]:
-    """Make a request to the Google Maps API with rate limiting."""
+async def make_api_request(client: httpx.AsyncClient, business_types: List[str], lat: float, lon: float, radius: float,
+                           fields: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    """Make a request to the Google Maps API with rate limiting, returning None if the request failed."""
     try:
         data = {
             "locationRestriction": {
@@ -286,96 +439,172 @@ def make_api_request(business_types: List[str], lat: float, lon: float, radius:
         }
 
         headers = {
-            "Content-Type": "application/json",
-            "X-Goog-Api-Key": GOOGLE_MAPS_API_KEY,
             "X-Goog-FieldMask": "places.id,places.displayName,places.formattedAddress,places.types,places.businessStatus,places.location"
         }
 
-        response = requests.post(BASE_URL_NEARBY_SEARCH, json=data, headers=headers)
+        response = await send_with_retry(client, "POST", BASE_URL_NEARBY_SEARCH, json=data, headers=headers)
         response.raise_for_status()
         
         if response.status_code != 200:
             logger.error(f"API Error: {response.status_code} - {response.text}")
-            return {}
+            return None
             
         return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error in make_api_request: {str(e)}\nResponse: {e.response.text if hasattr(e, 'response') else 'No response'}")
-        return {}
+    except httpx.HTTPError as e:
+        logger.error(f"Error in make_api_request: {str(e)}\nResponse: {e.response.text if isinstance(e, httpx.HTTPStatusError) else 'No response'}")
+        return None
+
+def _is_region_covered(lat: float, lon: float, radius: float,
+                       completed_regions: List[Tuple[float, float, float]]) -> bool:
+    """
+    Check whether a search circle lies inside a region whose results were not truncated.
+
+    Args:
+        lat (float): Latitude of the search center.
+        lon (float): Longitude of the search center.
+        radius (float): Search radius in meters.
+        completed_regions (List[Tuple[float, float, float]]): (lat, lon, radius) of regions that
+            returned fewer than ``MAX_RESULTS_PER_QUERY`` places.
+
+    Returns:
+        bool: True if the circle's places were all returned by an earlier query.
+    """
+    return any(
+        haversine_distance(lat, lon, region_lat, region_lon) + radius <= region_radius * REGION_CONTAINMENT_FACTOR
+        for region_lat, region_lon, region_radius in completed_regions
+    )
 
-def search_area(business_types: List[str], lon: float, lat: float, radius: float, 
-                all_leads: List[Dict[str, Any]], depth: int = 0, max_depth: int = 3, 
-                max_leads: Optional[int] = None, fields: Optional[List[str]] = None) -> bool:
+def _place_to_lead(place: Dict[str, Any]) -> GoogleMapsLeadDict:
     """
-    Recursively search an area for businesses using the Google Maps API.
+    Convert a Nearby Search place into a lead dictionary matching the GoogleMapsLead model.
 
     Args:
+        place (Dict[str, Any]): A place from the Nearby Search response.
+
+    Returns:
+        GoogleMapsLeadDict: The lead built from the place.
+    """
+    # Bind each place field once
+    website = place.get("websiteUri")
+    rating = place.get("rating")
+    rating_count = place.get("userRatingCount")
+    location = place.get("location")
+    return {
+        "id": place.get("id", ""),  # Required by GoogleMapsLead
+        "name": place.get("displayName", {}).get("text", ""),
+        "business_phone": place.get("nationalPhoneNumber") or place.get("internationalPhoneNumber", ""),
+        "formatted_address": place.get("formattedAddress", ""),
+        "website": str(website) if website else None,
+        "rating": float(rating) if rating else None,
+        "user_ratings_total": int(rating_count) if rating_count else None,
+        "types": place.get("types", []),
+        "business_status": place.get("businessStatus", ""),
+        "latitude": float(location.get("latitude", 0)) if location else None,
+        "longitude": float(location.get("longitude", 0)) if location else None,
+        "additional_properties": {},
+        "images": None,
+        "reviews": None,
+        "similar_businesses": None,
+        "about": None
+    }
+
+async def search_area(client: httpx.AsyncClient, business_types: List[str], lon: float, lat: float, radius: float,
+                      all_leads: List[GoogleMapsLeadDict], max_depth: int = 3,
+                      max_leads: Optional[int] = None, fields: Optional[List[str]] = None,
+                      on_new_lead: Optional[Callable[[GoogleMapsLeadDict], None]] = None,
+                      api_calls: Optional[Dict[str, int]] = None) -> bool:
+    """
+    Search an area for businesses using the Google Maps API, subdividing saturated circles.
+
+    Circles are processed breadth-first from a work queue in concurrent batches, and the
+    search stops as soon as ``max_leads`` is reached, cancelling any queries still in flight.
+
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client for API requests.
         business_types (List[str]): Types of businesses to search for.
         lon (float): Longitude of the search center.
         lat (float): Latitude of the search center.
         radius (float): Search radius in meters.
-        all_leads (List[Dict[str, Any]]): List to store all found leads.
-        depth (int): Current depth of recursion.
-        max_depth (int): Maximum depth of recursion.
+        all_leads (List[GoogleMapsLeadDict]): List to store all found leads.
+        max_depth (int): Maximum number of subdivision levels.
         max_leads (Optional[int]): Maximum number of leads to collect.
         fields (Optional[List[str]]): Fields to include in the detailed search.
+        on_new_lead (Optional[Callable[[GoogleMapsLeadDict], None]]): Called for each newly added lead.
+        api_calls (Optional[Dict[str, int]]): Counters updated with each dispatched Nearby Search call.
 
     Returns:
         bool: True if all places match the business types, False otherwise.
     """
-    if depth > max_depth or (max_leads and len(all_leads) >= max_leads):
-        return True
-
-    result = make_api_request(business_types, lat, lon, radius, fields)
-    places = result.get("places", [])
-    
+    def limit_reached() -> bool:
+        return bool(max_leads) and len(all_leads) >= max_leads
+
+    async def query(region: Tuple[float, float, float, int]) -> Tuple[Tuple[float, float, float, int], Optional[List[Dict[str, Any]]]]:
+        region_lon, region_lat, region_radius, _ = region
+        # Count on dispatch: a query cancelled after the lead limit is hit may already be billed
+        if api_calls is not None:
+            api_calls['nearby_search'] = api_calls.get('nearby_search', 0) + 1
+        result = await make_api_request(client, business_types, region_lat, region_lon, region_radius, fields)
+        return region, None if result is None else result.get("places", [])
+
+    business_types_lower = [bt.lower() for bt in business_types]
+    seen_ids = {lead["id"] for lead in all_leads}
+    # (lat, lon, radius) of circles whose query returned every place inside them
+    completed_regions: List[Tuple[float, float, float]] = []
+    queue = deque([(lon, lat, radius, 0)])
     fully_matched = True
-    for place in places:
-        if max_leads and len(all_leads) >= max_leads:
-            return fully_matched
-            
-        # Create lead dictionary matching GoogleMapsLead model
-        lead = {
-            "id": place.get("id", ""),  # Required by GoogleMapsLead
-            "name": place.get("displayName", {}).get("text", ""),
-            "business_phone": place.get("nationalPhoneNumber") or place.get("internationalPhoneNumber", ""),
-            "formatted_address": place.get("formattedAddress", ""),
-            "website": str(place.get("websiteUri", "")) if place.get("websiteUri") else None,
-            "rating": float(place.get("rating", 0)) if place.get("rating") else None,
-            "user_ratings_total": int(place.get("userRatingCount", 0)) if place.get("userRatingCount") else None,
-            "types": place.get("types", []),
-            "business_status": place.get("businessStatus", ""),
-            "latitude": float(place.get("location", {}).get("latitude", 0)) if place.get("location") else None,
-            "longitude": float(place.get("location", {}).get("longitude", 0)) if place.get("location") else None,
-            "additional_properties": {},
-            "images": None,
-            "reviews": None,
-            "similar_businesses": None,
-            "about": None
-        }
-        if lead["id"] not in [l["id"] for l in all_leads]:
-            all_leads.append(lead)
-        
-        place_types = set(place.get("types", []))
-        if not any(bt.lower() in place_types for bt in business_types):
-            fully_matched = False
-
-    if len(places) >= MAX_RESULTS_PER_QUERY and radius > MIN_RADIUS and (not max_leads or len(all_leads) < max_leads):
-        subcircles = three_circle_tiling(lon, lat, radius)
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = [executor.submit(search_area, business_types, sub_lon, sub_lat, sub_radius, all_leads, depth + 1, max_depth, max_leads, fields) 
-                       for sub_lon, sub_lat, sub_radius in subcircles]
-            wait(futures)
-            fully_matched = all(f.result() for f in futures)
-    elif radius > MIN_RADIUS and (not max_leads or len(all_leads) < max_leads):
-        new_radius = max(radius / 2, MIN_RADIUS)
-        fully_matched = search_area(business_types, lon, lat, new_radius, all_leads, depth + 1, max_depth, max_leads, fields)
+
+    while queue and not limit_reached():
+        batch = []
+        while queue and len(batch) < MAX_CONCURRENT_SEARCHES:
+            region = queue.popleft()
+            if not _is_region_covered(region[1], region[0], region[2], completed_regions):
+                batch.append(region)
+        if not batch:
+            continue
+
+        tasks = [asyncio.ensure_future(query(region)) for region in batch]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                (region_lon, region_lat, region_radius, depth), places = await next_done
+                if places is None:
+                    # A failed query says nothing about the circle, so it must not mark it as searched
+                    logger.warning(f"Nearby Search failed for circle ({region_lat}, {region_lon}, r={region_radius:.0f}m), skipping it")
+                    continue
+
+                for place in places:
+                    if limit_reached():
+                        break
+                    lead = _place_to_lead(place)
+                    if lead["id"] not in seen_ids:
+                        seen_ids.add(lead["id"])
+                        all_leads.append(lead)
+                        if on_new_lead:
+                            on_new_lead(lead)
+
+                    place_type_set = set(lead["types"])
+                    if not any(bt in place_type_set for bt in business_types_lower):
+                        fully_matched = False
+
+                if limit_reached():
+                    break
+                if len(places) < MAX_RESULTS_PER_QUERY:
+                    completed_regions.append((region_lat, region_lon, region_radius))
+                elif depth < max_depth and region_radius > MIN_RADIUS:
+                    queue.extend(
+                        (sub_lon, sub_lat, sub_radius, depth + 1)
+                        for sub_lon, sub_lat, sub_radius in three_circle_tiling(region_lon, region_lat, region_radius)
+                    )
+        finally:
+            # Stop queries that are no longer needed once the lead limit is hit
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     return fully_matched
 
-def fetch_leads_from_google_maps(business_types: List[str], location: str, max_leads: Optional[int] = None,
-                               fields: Optional[List[str]] = None) -> Dict[str, Any]:
-    """Fetch business leads from Google Maps."""
+async def fetch_leads_from_google_maps(business_types: List[str], location: str, max_leads: Optional[int] = None,
+                                       fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Fetch business leads from Google Maps using a shared async HTTP client."""
     logger.info(f"Fetching leads for {business_types} in {location}")
     
     if fields:
@@ -392,10 +621,11 @@ def fetch_leads_from_google_maps(business_types: List[str], location: str, max_l
                 "requires_scraper": True
             }
 
-    all_leads = []
+    all_leads: List[GoogleMapsLeadDict] = []
     incomplete_leads = []
 
-    bounding_box = get_bounding_box(location)
+    # Geocoding is a blocking call, keep it off the event loop
+    bounding_box = await asyncio.to_thread(get_bounding_box, location)
     if not bounding_box:
         logger.warning(f"Could not find bounding box for location: {location}")
         return []
@@ -408,24 +638,33 @@ def fetch_leads_from_google_maps(business_types: List[str], location: str, max_l
     # Track API calls during search
     api_calls = {
         'nearby_search': 0,
-        'place_details': 0
+        'place_details': 0,
+        'place_details_cache_hits': 0
     }
     
-    api_calls['nearby_search'] += 1
-    search_area(business_types, center_lng, center_lat, radius, all_leads, max_leads=max_leads, fields=fields)
-
-    if fields:
-        api_calls['place_details'] += len(all_leads)
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(get_place_details, lead['id'], fields) for lead in all_leads]
-            wait(futures)
-            for i, future in enumerate(futures):
-                details = future.result()
-                if isinstance(details, dict):  # Ensure details is a dictionary
-                    all_leads[i].update(details)
-
-    if max_leads:
-        all_leads = all_leads[:max_leads]
+    # One pooled HTTP/2 client per search: concurrent calls multiplex over shared connections
+    transport = httpx.AsyncHTTPTransport(http2=True, retries=HTTP_CONNECT_RETRIES, limits=HTTP_LIMITS)
+    # The API key is a client default header, so it is HPACK-indexed once per HTTP/2 connection
+    async with httpx.AsyncClient(timeout=HTTP_TIMEOUT, transport=transport, headers={"X-Goog-Api-Key": GOOGLE_MAPS_API_KEY},
+                                 event_hooks={"request": [places_rate_limiter.acquire]}) as client:
+        details_tasks: List[asyncio.Task] = []
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DETAILS)
+
+        async def fetch_details(lead: GoogleMapsLeadDict) -> None:
+            async with semaphore:
+                details = await get_place_details(client, lead['id'], fields, api_calls)
+            if isinstance(details, dict):  # Ensure details is a dictionary
+                lead.update(details)
+
+        def schedule_details(lead: GoogleMapsLeadDict) -> None:
+            # Start place details as soon as a lead is found, overlapping with the remaining search
+            details_tasks.append(asyncio.ensure_future(fetch_details(lead)))
+
+        await search_area(client, business_types, center_lng, center_lat, radius, all_leads, max_leads=max_leads,
+                          fields=fields, on_new_lead=schedule_details if fields else None, api_calls=api_calls)
+
+        if details_tasks:
+            await asyncio.gather(*details_tasks)
 
     # Filter out any non-dictionary entries
     all_leads = [lead for lead in all_leads if isinstance(lead, dict)]
@@ -440,7 +679,7 @@ def fetch_leads_from_google_maps(business_types: List[str], location: str, max_l
 
 def calculate_cost(api_calls: Dict[str, int], fields: List[str]) -> None:
     """
-    Calculate and print the estimated cost of API requests based on the SKUs used.
+    Calculate and log the estimated cost of API requests based on the SKUs used.
 
     Args:
         api_calls (Dict[str, int]): Dictionary containing the count of each type of API call.
@@ -470,13 +709,16 @@ def calculate_cost(api_calls: Dict[str, int], fields: List[str]) -> None:
         if any(field in atmosphere_fields for field in fields):
             total_cost += place_details_count * ATMOSPHERE_DATA_COST
     
-    # Print the cost breakdown
-    print(f"Cost breakdown:")
-    print(f"  Nearby Search: {nearby_search_count} calls, ${nearby_search_cost:.2f}")
-    print(f"  Place Details: {place_details_count} calls, ${place_details_cost:.2f}")
+    # Log the cost breakdown
+    logger.info("Cost breakdown:")
+    logger.info("  Nearby Search: %d calls, $%.2f", nearby_search_count, nearby_search_cost)
+    logger.info("  Place Details: %d calls, $%.2f", place_details_count, place_details_cost)
+    cache_hits = api_calls.get('place_details_cache_hits', 0)
+    if cache_hits:
+        logger.info("  Place Details cache hits: %d (not billed)", cache_hits)
     if fields:
-        print(f"  Additional data costs: ${total_cost - nearby_search_cost - place_details_cost:.2f}")
-    print(f"Total estimated cost: ${total_cost:.2f}")
+        logger.info("  Additional data costs: $%.2f", total_cost - nearby_search_cost - place_details_cost)
+    logger.info("Total estimated cost: $%.2f", total_cost)
 
 
 # Usage example:
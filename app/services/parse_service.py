@@ -6,6 +6,7 @@ including business types, locations, and additional keywords.
 """
 
 import spacy
+from functools import lru_cache
 from typing import Tuple, List, Optional
 
 # Load the spaCy model
@@ -13,6 +14,7 @@ nlp = spacy.load('en_core_web_sm')
 
 # Constants
 LOCATION_INDICATORS = ['in', 'at', 'near', 'around']
+PARSE_CACHE_SIZE = 4096
 
 def parse_query(query: str) -> Tuple[Optional[str], Optional[str]]:
     """
@@ -25,19 +27,14 @@ def parse_query(query: str) -> Tuple[Optional[str], Optional[str]]:
         Tuple[Optional[str], Optional[str]]: A tuple containing the business type and location.
     """
     doc = nlp(query)
-    business_type = None
-    location = None
 
-    locations = [ent.text for ent in doc.ents if ent.label_ in ('GPE', 'LOC')]
-    if locations:
-        location = locations[0]
+    # Only the first match of each is used, so stop scanning once it is found
+    location = next((ent.text for ent in doc.ents if ent.label_ in ('GPE', 'LOC')), None)
 
-    business_phrases = [
+    business_type = next((
         chunk.text for chunk in doc.noun_chunks
         if chunk.root.ent_type_ not in ('GPE', 'LOC') and chunk.root.pos_ != 'PRON'
-    ]
-    if business_phrases:
-        business_type = business_phrases[0]
+    ), None)
 
     return business_type, location
 
@@ -45,13 +42,28 @@ def parse_complex_query(query: str) -> Tuple[str, str, List[str]]:
     """
     Parse a complex query to extract business type, location, and additional keywords.
 
+    Results are memoized on the normalized query, so repeated queries skip parsing.
+
     Args:
         query (str): The input query string.
 
     Returns:
         Tuple[str, str, List[str]]: A tuple containing the business type, location, and a list of additional keywords.
     """
-    query = query.lower()
+    business_type, location, additional_keywords = _parse_complex_query_cached(' '.join(query.lower().split()))
+    return business_type, location, list(additional_keywords)
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_complex_query_cached(query: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """
+    Cached implementation of parse_complex_query for a normalized query.
+
+    Args:
+        query (str): The lowercased, whitespace-normalized query string.
+
+    Returns:
+        Tuple[str, str, Tuple[str, ...]]: The business type, location, and additional keywords.
+    """
     words = query.split()
     
     location_start = find_location_indicator(words)
@@ -65,7 +77,7 @@ def parse_complex_query(query: str) -> Tuple[str, str, List[str]]:
     
     additional_keywords = extract_additional_keywords(words, business_type, location)
     
-    return business_type.strip(), location.strip(), additional_keywords
+    return business_type.strip(), location.strip(), tuple(additional_keywords)
 
 def find_location_indicator(words: List[str]) -> int:
     """
@@ -1,5 +1,5 @@
 import redis
-import json
+import orjson
 import os
 from typing import List, Optional, Dict, Any
 import logging
@@ -24,7 +24,7 @@ class RedisService:
             cached_data = self.redis_client.get(cache_key)
             
             if cached_data:
-                leads = json.loads(cached_data)
+                leads = orjson.loads(cached_data)
                 return leads[:max_leads] if len(leads) >= max_leads else None
         except Exception as e:
             logger.error(f"Error getting cached leads: {e}")
@@ -36,7 +36,7 @@ class RedisService:
             self.redis_client.setex(
                 cache_key,
                 self.cache_ttl,
-                json.dumps(leads)
+                orjson.dumps(leads)  # Stored as UTF-8 JSON bytes
             )
         except Exception as e:
             logger.error(f"Error caching leads: {e}")
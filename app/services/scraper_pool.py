@@ -0,0 +1,155 @@
+"""
+Scraper Pool Module
+
+This module keeps a process-wide pool of warm GoogleMapsScraper instances so that
+Chrome start-up cost is paid once per worker instead of once per task.
+"""
+
+import logging
+import os
+from contextlib import contextmanager
+from queue import Empty, Queue
+from threading import Lock
+from typing import Iterator, Optional
+
+from app.services.gmaps_scraping_service import GoogleMapsScraper
+
+logger = logging.getLogger(__name__)
+
+# Constants
+SCRAPER_POOL_SIZE = int(os.getenv('SCRAPER_POOL_SIZE', 1))
+SCRAPER_MAX_THREADS = 4
+SCRAPER_ACQUIRE_TIMEOUT = 300  # seconds
+
+class ScraperPool:
+    """
+    A thread-safe pool of GoogleMapsScraper instances.
+
+    Scrapers are created lazily up to ``size`` and reused across checkouts.
+
+    Attributes:
+        size (int): Maximum number of scrapers kept by the pool.
+        headless (bool): Whether scrapers run the browser in headless mode.
+        max_threads (int): WebDriver pool size of each scraper.
+    """
+
+    def __init__(self, size: int = SCRAPER_POOL_SIZE, headless: bool = True, max_threads: int = SCRAPER_MAX_THREADS):
+        """
+        Initialize the ScraperPool.
+
+        Args:
+            size (int): Maximum number of scrapers kept by the pool.
+            headless (bool): Whether scrapers run the browser in headless mode.
+            max_threads (int): WebDriver pool size of each scraper.
+        """
+        self.size = size
+        self.headless = headless
+        self.max_threads = max_threads
+        self._idle: Queue = Queue(maxsize=size)
+        self._created = 0
+        self._lock = Lock()
+
+    def acquire(self, timeout: Optional[float] = SCRAPER_ACQUIRE_TIMEOUT) -> GoogleMapsScraper:
+        """
+        Check out a scraper, starting a new one if the pool is not yet full.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for a scraper to be released.
+
+        Returns:
+            GoogleMapsScraper: A ready-to-use scraper.
+
+        Raises:
+            TimeoutError: If no scraper becomes available within the timeout.
+        """
+        try:
+            return self._check_health(self._idle.get_nowait())
+        except Empty:
+            pass
+
+        with self._lock:
+            create = self._created < self.size
+            if create:
+                self._created += 1
+        if create:
+            try:
+                logger.info("Starting a new pooled GoogleMapsScraper")
+                return GoogleMapsScraper(headless=self.headless, max_threads=self.max_threads)
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        try:
+            scraper = self._idle.get(timeout=timeout)
+        except Empty:
+            raise TimeoutError("Timed out waiting for an available scraper")
+        return self._check_health(scraper)
+
+    def _check_health(self, scraper: GoogleMapsScraper) -> GoogleMapsScraper:
+        """
+        Replace any crashed browsers of a warm scraper before handing it out.
+
+        Args:
+            scraper (GoogleMapsScraper): The scraper taken from the idle queue.
+
+        Returns:
+            GoogleMapsScraper: The same scraper with responsive drivers.
+        """
+        try:
+            replaced = scraper.ensure_healthy()
+        except Exception:
+            # Could not even start a replacement browser; discard the scraper and give the slot back
+            try:
+                scraper.close()
+            except Exception as e:
+                logger.error(f"Error closing unhealthy scraper: {e}")
+            with self._lock:
+                self._created -= 1
+            raise
+        if replaced:
+            logger.info(f"Replaced {replaced} unresponsive WebDriver(s) in pooled scraper")
+        return scraper
+
+    def release(self, scraper: GoogleMapsScraper) -> None:
+        """
+        Return a scraper to the pool after clearing its per-run state.
+
+        Args:
+            scraper (GoogleMapsScraper): The scraper to return.
+        """
+        scraper.reset()
+        self._idle.put(scraper)
+
+    @contextmanager
+    def scraper(self) -> Iterator[GoogleMapsScraper]:
+        """
+        Context manager that checks a scraper out and always returns it.
+
+        Yields:
+            GoogleMapsScraper: A ready-to-use scraper.
+        """
+        scraper = self.acquire()
+        try:
+            yield scraper
+        finally:
+            self.release(scraper)
+
+    def close(self) -> None:
+        """
+        Close all idle scrapers in the pool.
+        """
+        while True:
+            try:
+                scraper = self._idle.get_nowait()
+            except Empty:
+                break
+            try:
+                scraper.close()
+            except Exception as e:
+                logger.error(f"Error closing pooled scraper: {e}")
+            with self._lock:
+                self._created -= 1
+        logger.info("Scraper pool closed.")
+
+scraper_pool = ScraperPool()
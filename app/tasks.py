@@ -1,26 +1,60 @@
 from app.celery import celery_app
 from celery import states
+from celery.signals import worker_process_shutdown, worker_shutdown
 from app.services.google_maps_service import fetch_leads_from_google_maps
-from app.services.gmaps_scraping_service import GoogleMapsScraper
-from app.models.google_maps_lead import GoogleMapsLead
+from app.services.scraper_pool import scraper_pool
+from app.models.google_maps_lead import GoogleMapsLead, GOOGLE_MAPS_LEADS_ADAPTER
 from app.utils.database import upload_google_maps_leads_to_supabase, get_user_tokens, update_user_tokens, generate_business_hash
 from app.services.parse_service import parse_complex_query
 from app.services.redis_service import RedisService
 import asyncio
-from typing import List, Optional
+from pydantic import ValidationError
+from typing import Dict, List, Optional
 import logging
+import time
 import traceback
 
 logger = logging.getLogger(__name__)
 
+# Identical requests queued within this window share one task while it is still running
+INFLIGHT_TASK_TTL = 3600  # seconds
+MAX_INFLIGHT_TASKS = 1024
+INFLIGHT_WAIT_TIMEOUT = 30  # seconds a coalesced request waits for the first caller to publish
+
 def calculate_max_tokens(max_leads: int, fields: list) -> int:
     """Calculate maximum possible token cost"""
     base_cost = max_leads  # 1 token per lead
     field_multiplier = len(fields) * 0.1 if fields else 1  # 10% extra per field
     return int(base_cost * max(1, field_multiplier) * 1.2)  # Add 20% buffer
 
+def scrape_with_pool(loop: asyncio.AbstractEventLoop, query: str, fields: Optional[List[str]]) -> List[dict]:
+    """Run the Google Maps scraper for a query using a pooled scraper instance"""
+    with scraper_pool.scraper() as scraper:
+        url = scraper.generate_search_url(query)
+        return loop.run_until_complete(scraper.scrape(url, fields))
+
+def validate_leads(raw_leads: List[dict]) -> List[dict]:
+    """Validate raw lead dicts in one pass, falling back to per-lead validation to skip invalid entries"""
+    try:
+        return GOOGLE_MAPS_LEADS_ADAPTER.dump_python(GOOGLE_MAPS_LEADS_ADAPTER.validate_python(raw_leads))
+    except ValidationError:
+        leads = []
+        for result in raw_leads:
+            try:
+                leads.append(GoogleMapsLead(**result).model_dump())
+            except ValidationError as e:
+                logger.error(f"Error creating GoogleMapsLead from result: {result}")
+                logger.error(f"Error details: {str(e)}")
+        return leads
+
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def close_scraper_pool(**kwargs):
+    """Shut down pooled browsers when the worker exits"""
+    scraper_pool.close()
+
 @celery_app.task(bind=True)
-def fetch_leads_task(self, query, max_leads, fields, user_id, matched_business_type=None):
+def fetch_leads_task(self, query, max_leads, fields, user_id, matched_business_types=None):
     """Celery task for fetching Google Maps leads"""
     self.update_state(state=states.STARTED)
     redis_service = RedisService()
@@ -50,39 +84,33 @@ def fetch_leads_task(self, query, max_leads, fields, user_id, matched_business_t
             }
 
         # If not in cache, proceed with scraping
-        if matched_business_type:
-            business_type = matched_business_type
-            _, location, _ = parse_complex_query(query)
-        else:
-            business_type, location, _ = parse_complex_query(query)
+        business_type, location, _ = parse_complex_query(query)
+        business_types = matched_business_types or ([business_type] if business_type else [])
         
-        if business_type and location:
-            results = fetch_leads_from_google_maps([business_type], location, max_leads, fields)
-            logger.debug(f"Results from fetch_leads_from_google_maps: {results}")
+        if business_types and location:
+            # All matched types go into a single Nearby Search request via includedTypes
+            results = loop.run_until_complete(fetch_leads_from_google_maps(business_types, location, max_leads, fields))
+            logger.debug("Results from fetch_leads_from_google_maps: %s", results)
             
             # Check if we need to use scraper instead
             if isinstance(results, dict) and results.get("requires_scraper"):
                 logger.info("Switching to scraper due to requested fields")
-                scraper = GoogleMapsScraper(headless=True, max_threads=4)
-                url = scraper.generate_search_url(query)
-                results = loop.run_until_complete(scraper.scrape(url, fields))
-                scraper.close()
+                results = scrape_with_pool(loop, query, fields)
             elif isinstance(results, dict):
                 results = results.get("leads", [])
         else:
-            scraper = GoogleMapsScraper(headless=True, max_threads=4)
-            url = scraper.generate_search_url(query)
-            results = loop.run_until_complete(scraper.scrape(url, fields))
-            scraper.close()
+            results = scrape_with_pool(loop, query, fields)
         
+        raw_leads = []
         if results and isinstance(results, list):
-            google_maps_leads = []
-            google_maps_leads_dict = []
+            seen_hashes = set()
             for result in results:
+                if len(raw_leads) >= max_leads:
+                    break
                 if isinstance(result, dict):
                     try:
                         # Log the result for debugging
-                        logger.info(f"Processing result: {result}")
+                        logger.debug("Processing result: %s", result)
                         
                         # Ensure coordinates exist
                         if 'latitude' not in result or 'longitude' not in result:
@@ -90,23 +118,28 @@ def fetch_leads_task(self, query, max_leads, fields, user_id, matched_business_t
                             continue
                         
                         # Generate hash using name and coordinates
-                        result['id'] = generate_business_hash(
+                        lead_hash = generate_business_hash(
                             result['name'],
                             result['latitude'],  # Remove .get() since we verified they exist
                             result['longitude']
                         )
-                        lead = GoogleMapsLead(**result)
-                        google_maps_leads.append(lead)
-                        google_maps_leads_dict.append(lead.dict())
+                        # Overlapping search areas return the same business more than once
+                        if lead_hash in seen_hashes:
+                            continue
+                        seen_hashes.add(lead_hash)
+                        result['id'] = lead_hash
+                        raw_leads.append(result)
                     except Exception as e:
-                        logger.error(f"Error creating GoogleMapsLead from result: {result}")
+                        logger.error(f"Error preparing lead from result: {result}")
                         logger.error(f"Error details: {str(e)}")
                 else:
                     logger.error(f"Invalid result type: {type(result)}, expected dict. Value: {result}")
         else:
             logger.error(f"Invalid results type: {type(results)}, expected list. Value: {results}")
-            google_maps_leads = []
-            google_maps_leads_dict = []
+        # Validate once and keep only the serialized form; models are rebuilt in the background task
+        google_maps_leads_dict = validate_leads(raw_leads)
+        # Raw results are no longer needed once serialized
+        results = raw_leads = None
 
         # Prepare response data
         response_data = {
@@ -123,7 +156,7 @@ def fetch_leads_task(self, query, max_leads, fields, user_id, matched_business_t
             actual_cost = int(actual_cost * (1 + len(fields) * 0.1))
 
         # Queue background task with actual cost
-        if google_maps_leads:
+        if google_maps_leads_dict:
             process_google_maps_leads_background.delay(
                 query=query, 
                 google_maps_leads_dict=google_maps_leads_dict, 
@@ -150,7 +183,8 @@ def process_google_maps_leads_background(query: str, google_maps_leads_dict: Lis
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         
-        google_maps_leads = [GoogleMapsLead(**lead) for lead in google_maps_leads_dict]
+        # Leads were validated in fetch_leads_task before being queued, so skip re-validation
+        google_maps_leads = [GoogleMapsLead.model_construct(**lead) for lead in google_maps_leads_dict]
         
         # Run all background operations with actual token cost
         loop.run_until_complete(asyncio.gather(
@@ -169,11 +203,57 @@ def process_google_maps_leads_background(query: str, google_maps_leads_dict: Lis
         return False
 
 class TaskManager:
-    async def fetch_leads(self, query: str, max_leads: int, fields: Optional[List[str]], user_id: str, matched_business_type: Optional[str] = None):
-        # Create Celery task with the matched business type
-        task = fetch_leads_task.delay(query, max_leads, fields, user_id, matched_business_type)
+    def __init__(self):
+        # Request key -> future resolving to (task_id, published_at) for recently queued tasks
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+    async def fetch_leads(self, query: str, max_leads: int, fields: Optional[List[str]], user_id: str, matched_business_types: Optional[List[str]] = None):
+        # Coalesce identical concurrent requests from the same user onto one task
+        key = (user_id, query.lower(), max_leads, tuple(sorted(fields)) if fields else None)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            task_id = await self._get_active_task_id(pending)
+            if task_id:
+                logger.info(f"Reusing in-flight task {task_id} for identical request")
+                return task_id
+            if self._inflight.get(key) is pending:
+                del self._inflight[key]
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        while len(self._inflight) > MAX_INFLIGHT_TASKS:
+            del self._inflight[next(iter(self._inflight))]
+        try:
+            # Create Celery task with the matched business types; publishing to the broker blocks, so run it off the event loop
+            task = await asyncio.to_thread(fetch_leads_task.delay, query, max_leads, fields, user_id, matched_business_types)
+        except BaseException as e:
+            # Always resolve the future, including on cancellation, so waiters never block on it
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                future.exception()  # Mark as retrieved; waiters fall back to queuing their own task
+            else:
+                future.cancel()
+            raise
+        future.set_result((str(task.id), time.monotonic()))
         return str(task.id)
 
+    async def _get_active_task_id(self, pending: asyncio.Future) -> Optional[str]:
+        """Return the task id of a coalesced request if that task is recent and still queued or running"""
+        try:
+            task_id, published_at = await asyncio.wait_for(asyncio.shield(pending), INFLIGHT_WAIT_TIMEOUT)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise  # This waiter itself was cancelled
+            return None
+        except Exception:  # Includes timing out on a first caller that never published
+            return None
+        if time.monotonic() - published_at > INFLIGHT_TASK_TTL:
+            return None
+        state = await asyncio.to_thread(lambda: fetch_leads_task.AsyncResult(task_id).state)
+        return task_id if state in (states.PENDING, states.STARTED) else None
+
     def get_task_status(self, task_id, user_id):
         task = fetch_leads_task.AsyncResult(task_id)
         if task.state == states.PENDING:
@@ -2,12 +2,14 @@
 Auth Utils
 """
 
-from fastapi import HTTPException, status, Depends, Request
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import HTTPException, status, Depends, Security
+from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
 import jwt
 import os
 import logging
-from .database import SupabaseClientSingleton
+import secrets
+from supabase import Client
+from .database import get_supabase
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -17,14 +19,20 @@ jwt_secret = os.environ.get("SUPABASE_JWT_SECRET")
 if not jwt_secret:
     raise ValueError("SUPABASE_JWT_SECRET is not set in environment variables")
 
+# Expected API key, encoded once for constant-time comparison
+expected_api_key = os.environ.get("API_KEY", "").encode()
+
 security = HTTPBearer()
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security),
+                           supabase: Client = Depends(get_supabase)):
     """
     Verify and decode the JWT token from Supabase.
     
     Args:
         credentials (HTTPAuthorizationCredentials): The credentials containing the JWT token.
+        supabase (Client): The application's shared Supabase client.
         
     Returns:
         str: The user ID from the token.
@@ -34,9 +42,6 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     """
     token = credentials.credentials
     try:
-        # Get Supabase client instance
-        supabase = SupabaseClientSingleton.get_instance()
-        
         # Decode the JWT token with the Supabase JWT secret
         payload = jwt.decode(
             token, 
@@ -84,12 +89,15 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             detail="Error processing authentication token"
         )
 
-def verify_api_key(request: Request) -> str:
+def verify_api_key(api_key: str = Security(api_key_header)) -> str:
     """
-    Verify the API key from the request headers.
+    Verify the API key from the X-API-Key header.
+
+    Declared as a security dependency so it is documented in OpenAPI and resolved
+    from headers alone, and compared in constant time.
     
     Args:
-        request (Request): The FastAPI request object.
+        api_key (str): The API key taken from the X-API-Key header.
         
     Returns:
         str: The API key if valid.
@@ -97,8 +105,7 @@ def verify_api_key(request: Request) -> str:
     Raises:
         HTTPException: If the API key is invalid or missing.
     """
-    api_key = request.headers.get("X-API-Key")
-    if not api_key or api_key != os.environ.get("API_KEY"):
+    if not api_key or not expected_api_key or not secrets.compare_digest(api_key.encode(), expected_api_key):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key"
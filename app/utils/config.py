@@ -6,7 +6,7 @@ including API keys, database credentials, and business type mappings.
 """
 
 import os
-from typing import Dict, List
+from typing import Dict, FrozenSet, List
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -61,6 +61,9 @@ VALID_BUSINESS_TYPES: List[str] = [
     "travel_agency", "university", "veterinary_care", "zoo"
 ]
 
+# Prebuilt set for O(1) membership checks against the business type vocabulary
+VALID_BUSINESS_TYPES_SET: FrozenSet[str] = frozenset(VALID_BUSINESS_TYPES)
+
 BUSINESS_TYPE_KEYWORDS: Dict[str, List[str]] = {
     "restaurant": ["restaurant", "cafe", "bar", "meal_takeaway"],
     "cafe": ["cafe", "restaurant", "bakery"],
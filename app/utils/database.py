@@ -6,15 +6,16 @@ including reading leads from JSON files and uploading leads to Supabase.
 """
 
 import os
-import json
 import asyncio
 import logging
 from typing import List, Dict, Any, Optional
+import orjson
+from fastapi import Request
 from supabase import create_client, Client
 from geopy.distance import geodesic
 import hashlib
 
-from app.models.google_maps_lead import GoogleMapsLead
+from app.models.google_maps_lead import GoogleMapsLead, GOOGLE_MAPS_LEADS_ADAPTER
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -22,6 +23,8 @@ logger = logging.getLogger(__name__)
 # Constants
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
+SUPABASE_BATCH_SIZE = 100  # rows per upsert request
+MAX_CONCURRENT_UPLOADS = 8
 ENCODINGS = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
 
 class SupabaseClientSingleton:
@@ -37,6 +40,19 @@ class SupabaseClientSingleton:
             cls._instance = create_client(url, key)
         return cls._instance
 
+def get_supabase(request: Request) -> Client:
+    """
+    FastAPI dependency returning the Supabase client created in the application lifespan.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        Client: The shared Supabase client, falling back to the singleton if the lifespan did not run.
+    """
+    supabase = getattr(request.app.state, "supabase", None)
+    return supabase if supabase is not None else SupabaseClientSingleton.get_instance()
+
 def read_leads_from_json(file_path: str) -> List[Dict[str, Any]]:
     """
     Read leads from a JSON file, trying multiple encodings.
@@ -50,15 +66,17 @@ def read_leads_from_json(file_path: str) -> List[Dict[str, Any]]:
     Raises:
         ValueError: If unable to read the file with any of the attempted encodings.
     """
+    with open(file_path, 'rb') as file:
+        raw = file.read()
+
     for encoding in ENCODINGS:
         try:
-            with open(file_path, 'r', encoding=encoding) as file:
-                leads = json.load(file)
+            leads = orjson.loads(raw.decode(encoding))
             logger.info(f"Successfully read the file using {encoding} encoding.")
             return leads
         except UnicodeDecodeError:
             continue
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning(f"Failed to parse JSON with {encoding} encoding.")
             continue
     
@@ -104,63 +122,64 @@ def get_existing_leads(business_type: str, latitude: float, longitude: float, ra
 
 async def upload_google_maps_leads_to_supabase(leads: List[GoogleMapsLead]) -> None:
     """
-    Upload a list of Google Maps leads to Supabase.
+    Upload a list of Google Maps leads to Supabase in concurrent batches.
 
     Args:
         leads (List[GoogleMapsLead]): List of leads to upload.
     """
     total_leads = len(leads)
-    successful_uploads = 0
-    failed_uploads = 0
+    batches = [leads[i:i + SUPABASE_BATCH_SIZE] for i in range(0, total_leads, SUPABASE_BATCH_SIZE)]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
 
-    for lead in leads:
-        result = await upload_google_maps_lead_with_retry(lead)
-        if result:
-            successful_uploads += 1
-        else:
-            failed_uploads += 1
+    async def upload_batch(batch: List[GoogleMapsLead]) -> int:
+        async with semaphore:
+            return await upload_google_maps_leads_batch_with_retry(batch)
+
+    results = await asyncio.gather(*(upload_batch(batch) for batch in batches))
+    successful_uploads = sum(results)
+    # Count failures per failed batch, so duplicate ids collapsed within a batch are not reported as failed
+    failed_uploads = sum(len(batch) for batch, uploaded in zip(batches, results) if not uploaded)
 
     logger.info(f"Upload summary: Total leads: {total_leads}, Successful: {successful_uploads}, Failed: {failed_uploads}")
 
-async def upload_google_maps_lead_with_retry(lead: GoogleMapsLead, max_retries: int = MAX_RETRIES) -> bool:
+async def upload_google_maps_leads_batch_with_retry(leads: List[GoogleMapsLead], max_retries: int = MAX_RETRIES) -> int:
     """
-    Upload a single Google Maps lead to Supabase with retry logic.
+    Upload a batch of Google Maps leads to Supabase in a single upsert with retry logic.
 
     Args:
-        lead (GoogleMapsLead): The lead to upload.
+        leads (List[GoogleMapsLead]): The leads to upload.
         max_retries (int): Maximum number of retry attempts.
 
     Returns:
-        bool: True if upload was successful, False otherwise.
+        int: Number of distinct leads uploaded, 0 if the batch failed.
     """
     supabase = SupabaseClientSingleton.get_instance()
 
-    # Generate a hash for the lead
-    lead_hash = generate_business_hash(lead.name, lead.latitude, lead.longitude)
-    lead.id = lead_hash  # Set the hash as the id
+    # Leads already carry their business hash as id (set in fetch_leads_task); serialize the batch in one pass
+    # and key rows by id, since a single upsert cannot touch the same id twice
+    rows = {row["id"]: row for row in GOOGLE_MAPS_LEADS_ADAPTER.dump_python(leads, mode="json")}
+    batch = list(rows.values())
 
     for attempt in range(max_retries):
         try:
-            lead_dict = lead.dict()
-            logger.debug(f"Attempting to upsert lead: {lead.name}")
-            logger.debug(f"Lead data: {lead_dict}")
-            # Use upsert to handle duplicates based on the id
-            response = supabase.table("google_maps_leads").upsert(
-                lead_dict, on_conflict="id"
-            ).execute()
+            logger.debug(f"Attempting to upsert batch of {len(batch)} leads")
+            # Run the blocking client call in a thread so batches can overlap
+            response = await asyncio.to_thread(
+                supabase.table("google_maps_leads").upsert(batch, on_conflict="id").execute
+            )
             if response.data:
-                logger.info(f"Successfully upserted lead: {lead.name}")
-                return True
+                logger.info(f"Successfully upserted batch of {len(batch)} leads")
+                return len(batch)
             else:
-                logger.warning(f"Failed to upsert lead: {lead.name}. Response: {response}")
+                logger.warning(f"Failed to upsert batch of {len(batch)} leads. Response: {response}")
         except Exception as e:
-            logger.error(f"Error upserting lead {lead.name}: {str(e)}")
+            logger.error(f"Error upserting batch of {len(batch)} leads: {str(e)}")
         
         if attempt < max_retries - 1:
             await asyncio.sleep(RETRY_DELAY * (2 ** attempt))  # Exponential backoff
 
-    logger.error(f"Failed to upsert lead {lead.name} after {max_retries} attempts")
-    return False
+    logger.error(f"Failed to upsert batch of {len(batch)} leads after {max_retries} attempts")
+    return 0
 
 def generate_business_hash(name: str, latitude: float, longitude: float) -> str:
     """
@@ -6,6 +6,7 @@ and working with geographical coordinates.
 """
 
 import logging
+from functools import lru_cache
 from typing import Tuple, Optional, List
 from math import radians, sin, cos, sqrt, atan2
 from geopy.geocoders import Nominatim
@@ -18,28 +19,49 @@ logger = logging.getLogger(__name__)
 EARTH_RADIUS_METERS = 6371000
 DEFAULT_BOUNDING_BOX_RADIUS_KM = 50
 DEGREES_TO_RADIANS = 3.141592653589793 / 180
+GEOCODE_CACHE_SIZE = 10000
+
+# Shared geocoder, created once instead of per lookup
+geolocator = Nominatim(user_agent="your_app_name")
 
 def get_lat_lng_from_address(address: str) -> Tuple[Optional[float], Optional[float]]:
     """
     Get latitude and longitude coordinates for a given address.
 
+    Lookups are cached on the normalized address; transient geocoder errors are not cached.
+
     Args:
         address (str): The address to geocode.
 
     Returns:
         Tuple[Optional[float], Optional[float]]: Latitude and longitude, or (None, None) if geocoding fails.
     """
-    geolocator = Nominatim(user_agent="your_app_name")
     try:
-        location = geolocator.geocode(address)
-        if location:
-            return location.latitude, location.longitude
-        logger.warning(f"Could not find coordinates for address: {address}")
-        return None, None
+        return _geocode_cached(' '.join(address.lower().split()))
     except (GeocoderTimedOut, GeocoderUnavailable) as e:
         logger.error(f"Geocoding error: {e}")
         return None, None
 
+@lru_cache(maxsize=GEOCODE_CACHE_SIZE)
+def _geocode_cached(address: str) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Geocode a normalized address, memoizing the result.
+
+    Args:
+        address (str): The lowercased, whitespace-normalized address.
+
+    Returns:
+        Tuple[Optional[float], Optional[float]]: Latitude and longitude, or (None, None) if not found.
+
+    Raises:
+        GeocoderTimedOut, GeocoderUnavailable: If the geocoding service fails.
+    """
+    location = geolocator.geocode(address)
+    if location:
+        return location.latitude, location.longitude
+    logger.warning(f"Could not find coordinates for address: {address}")
+    return None, None
+
 def get_bounding_box(location: str) -> Optional[Tuple[float, float, float, float]]:
     """
     Calculate a bounding box around a given location.
@@ -6,14 +6,23 @@ the best matches for business types based on user queries.
 """
 
 import re
-from typing import List, Optional
-from difflib import SequenceMatcher
-from fuzzywuzzy import process, fuzz
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+from rapidfuzz import fuzz, process, utils
 
-from app.utils.config import VALID_BUSINESS_TYPES, BUSINESS_TYPE_KEYWORDS
+from app.utils.config import VALID_BUSINESS_TYPES, VALID_BUSINESS_TYPES_SET, BUSINESS_TYPE_KEYWORDS
 
 # Constants
 DEFAULT_SIMILARITY_THRESHOLD = 80
+MATCH_CACHE_SIZE = 4096
+MIN_KEYWORD_WORD_LENGTH = 3  # shorter query words ("a", "in", "of") are not matched against keywords
+KEYWORD_SYNONYM_WEIGHT = 0.9  # types reached through a BUSINESS_TYPE_KEYWORDS entry rank below direct matches
+SYNONYM_RANK_STEP = 1.0  # score drop per position in a keyword's type list, so expansions never tie
+UNMATCHED_WORD_PENALTY = 10  # score drop per query word that none of a directly matched type's words match
+MAX_MATCHED_BUSINESS_TYPES = 3  # maximum number of matched business types searched per query
+MATCHED_BUSINESS_TYPE_SCORE_MARGIN = 5  # extra direct matches must score within this many points of the best
+PLURAL_SUFFIX_PATTERN = re.compile(r'(es|s)$')
+GERUND_SUFFIX_PATTERN = re.compile(r'ing$')
 
 def simple_stem(word: str) -> str:
     """
@@ -26,8 +35,8 @@ def simple_stem(word: str) -> str:
         str: The stemmed word.
     """
     word = word.lower()
-    word = re.sub(r'(es|s)$', '', word)  # Remove 'es' or 's' from the end
-    word = re.sub(r'ing$', '', word)     # Remove 'ing' from the end
+    word = PLURAL_SUFFIX_PATTERN.sub('', word)  # Remove 'es' or 's' from the end
+    word = GERUND_SUFFIX_PATTERN.sub('', word)  # Remove 'ing' from the end
     return word
 
 def stem_phrase(phrase: str) -> str:
@@ -53,7 +62,65 @@ def calculate_similarity(a: str, b: str) -> float:
     Returns:
         float: The similarity ratio between 0 and 1.
     """
-    return SequenceMatcher(None, a, b).ratio()
+    return fuzz.ratio(a, b) / 100.0
+
+def normalize_business_type(value: str) -> str:
+    """
+    Normalize a business type to the vocabulary's form: lowercase words joined by underscores.
+
+    Args:
+        value (str): The business type to normalize.
+
+    Returns:
+        str: The normalized business type (e.g. "Car  Wash" -> "car_wash").
+    """
+    return '_'.join(value.lower().split())
+
+def _stem_business_type(value: str) -> str:
+    """
+    Stem each word of a business type and join them in the vocabulary's underscore form.
+
+    Args:
+        value (str): The business type to stem.
+
+    Returns:
+        str: The stemmed, underscore-joined business type.
+    """
+    return '_'.join(simple_stem(word) for word in value.split())
+
+def _build_stem_index(valid_types: Sequence[str]) -> Tuple[Dict[str, str], Tuple[Tuple[str, str], ...]]:
+    """
+    Precompute the stemmed forms of a list of valid types.
+
+    Args:
+        valid_types (Sequence[str]): List of valid business types.
+
+    Returns:
+        Tuple[Dict[str, str], Tuple[Tuple[str, str], ...]]: A stem -> type map for
+        exact lookups and the ordered (stem, type) pairs for partial matching.
+    """
+    stemmed = tuple((_stem_business_type(valid_type), valid_type) for valid_type in valid_types)
+    exact: Dict[str, str] = {}
+    for valid_type_stemmed, valid_type in stemmed:
+        # Keep the first type for a stem, matching the original scan order
+        exact.setdefault(valid_type_stemmed, valid_type)
+    return exact, stemmed
+
+# Normalized and stem indexes for the default vocabulary, built once at import time
+_BUSINESS_TYPE_NORMALIZED: Dict[str, str] = {
+    normalize_business_type(valid_type): valid_type for valid_type in VALID_BUSINESS_TYPES
+}
+_BUSINESS_TYPE_EXACT, _BUSINESS_TYPE_STEMS = _build_stem_index(VALID_BUSINESS_TYPES)
+
+# Word tokens of each valid type, and of each keyword entry with the valid types it expands to,
+# prebuilt for the keyword matching pass
+_BUSINESS_TYPE_TOKENS = tuple(
+    (valid_type, tuple(valid_type.split('_'))) for valid_type in VALID_BUSINESS_TYPES
+)
+_BUSINESS_TYPE_SYNONYMS = tuple(
+    (tuple(keyword.lower().split()), tuple(t for t in types if t in VALID_BUSINESS_TYPES_SET))
+    for keyword, types in BUSINESS_TYPE_KEYWORDS.items()
+)
 
 def find_exact_match(query: str, valid_types: List[str]) -> Optional[str]:
     """
@@ -67,24 +134,49 @@ def find_exact_match(query: str, valid_types: List[str]) -> Optional[str]:
     Returns:
         Optional[str]: The matched business type if found, None otherwise.
     """
-    query_stemmed = stem_phrase(query)
-    
-    for valid_type in valid_types:
-        valid_type_stemmed = stem_phrase(valid_type)
-        if query_stemmed == valid_type_stemmed:
-            return valid_type
+    if valid_types is VALID_BUSINESS_TYPES:
+        if query in VALID_BUSINESS_TYPES_SET:
+            return query
+        # O(1) hit for case/spacing variants such as "Car Wash"
+        match = _BUSINESS_TYPE_NORMALIZED.get(normalize_business_type(query))
+        if match is not None:
+            return match
+        exact, stemmed = _BUSINESS_TYPE_EXACT, _BUSINESS_TYPE_STEMS
+    else:
+        exact, stemmed = _build_stem_index(valid_types)
+
+    query_stemmed = _stem_business_type(query)
+    match = exact.get(query_stemmed)
+    if match is not None:
+        return match
     
     # If no exact match found, try partial matching
-    for valid_type in valid_types:
-        valid_type_stemmed = stem_phrase(valid_type)
+    for valid_type_stemmed, valid_type in stemmed:
         if query_stemmed in valid_type_stemmed or valid_type_stemmed in query_stemmed:
             return valid_type
     
     return None
 
+def _word_variants(word: str) -> Tuple[str, ...]:
+    """
+    Get the forms of a query word compared against type tokens.
+
+    Args:
+        word (str): A lowercased query word.
+
+    Returns:
+        Tuple[str, ...]: The word itself, its stem and, for "-ies" plurals, the "-y" singular.
+    """
+    variants = {word, simple_stem(word)}
+    if word.endswith('ies'):
+        variants.add(word[:-3] + 'y')
+    return tuple(variants)
+
 def find_best_matches(query: str, threshold: int = DEFAULT_SIMILARITY_THRESHOLD) -> List[str]:
     """
-    Find the best matching business types for a given query.
+    Find the best matching business types for a given query, best score first.
+
+    Results are memoized on the lowercased query and threshold.
     
     Args:
         query (str): The user's input query.
@@ -93,17 +185,109 @@ def find_best_matches(query: str, threshold: int = DEFAULT_SIMILARITY_THRESHOLD)
     Returns:
         List[str]: A list of matched business types.
     """
-    query_words = query.lower().split()
-    matched_types = set()
+    return [business_type for business_type, _, _ in find_scored_matches(query, threshold)]
 
-    for word in query_words:
-        for business_type, keywords in BUSINESS_TYPE_KEYWORDS.items():
-            if any(fuzz.partial_ratio(word, keyword.lower()) >= threshold for keyword in keywords):
-                matched_types.add(business_type)
+def find_scored_matches(query: str, threshold: int = DEFAULT_SIMILARITY_THRESHOLD) -> List[Tuple[str, float, bool]]:
+    """
+    Find the best matching business types for a given query along with their scores.
+
+    Args:
+        query (str): The user's input query.
+        threshold (int): The minimum similarity score to consider a match.
+
+    Returns:
+        List[Tuple[str, float, bool]]: (business type, score out of 100, matched directly) triples,
+        best score first. Types only reached through ``BUSINESS_TYPE_KEYWORDS`` are not direct.
+    """
+    return list(_find_best_matches_cached(query.lower().strip(), threshold))
+
+def select_business_types(query: str, threshold: int = DEFAULT_SIMILARITY_THRESHOLD) -> List[str]:
+    """
+    Choose the business types to search together for a query that has no exact match.
+
+    Only direct matches scoring within ``MATCHED_BUSINESS_TYPE_SCORE_MARGIN`` of the best are combined;
+    when the best match comes from a keyword expansion, only that single type is used.
+
+    Args:
+        query (str): The user's input query.
+        threshold (int): The minimum similarity score to consider a match.
+
+    Returns:
+        List[str]: Up to ``MAX_MATCHED_BUSINESS_TYPES`` business types, or an empty list if none match.
+    """
+    matches = find_scored_matches(query, threshold)
+    if not matches:
+        return []
+    best_type, best_score, best_direct = matches[0]
+    if not best_direct:
+        return [best_type]
+    return [
+        business_type for business_type, score, direct in matches
+        if direct and best_score - score <= MATCHED_BUSINESS_TYPE_SCORE_MARGIN
+    ][:MAX_MATCHED_BUSINESS_TYPES]
+
+@lru_cache(maxsize=MATCH_CACHE_SIZE)
+def _find_best_matches_cached(query: str, threshold: int) -> Tuple[Tuple[str, float, bool], ...]:
+    """
+    Cached implementation of find_scored_matches for a normalized query.
 
-    if not matched_types:
+    A type scores the mean, over its word tokens, of each token's best ``fuzz.ratio``
+    against the query words, less a penalty for each query word none of its tokens match.
+    Keyword expansions score by their position in the keyword's list, so they never tie.
+
+    Args:
+        query (str): The lowercased user query.
+        threshold (int): The minimum similarity score to consider a match.
+
+    Returns:
+        Tuple[Tuple[str, float, bool], ...]: The matched business types, scores and direct flags,
+        best score first.
+    """
+    words = [word for word in query.split() if len(word) >= MIN_KEYWORD_WORD_LENGTH]
+    word_variants = [_word_variants(word) for word in words]
+    variants = {variant for variants_of_word in word_variants for variant in variants_of_word}
+    scores: Dict[str, Tuple[float, bool]] = {}
+
+    if variants:
+        token_scores: Dict[str, float] = {}
+
+        def token_score(token: str) -> float:
+            if token not in token_scores:
+                token_scores[token] = max(fuzz.ratio(token, variant) for variant in variants)
+            return token_scores[token]
+
+        for business_type, tokens in _BUSINESS_TYPE_TOKENS:
+            score = sum(map(token_score, tokens)) / len(tokens)
+            if score < threshold:
+                continue
+            unmatched_words = sum(
+                1 for variants_of_word in word_variants
+                if not any(fuzz.ratio(token, variant, score_cutoff=threshold)
+                           for token in tokens for variant in variants_of_word)
+            )
+            score -= unmatched_words * UNMATCHED_WORD_PENALTY
+            if score >= threshold:
+                scores[business_type] = (score, True)
+
+        for tokens, business_types in _BUSINESS_TYPE_SYNONYMS:
+            keyword_score = sum(map(token_score, tokens)) / len(tokens) * KEYWORD_SYNONYM_WEIGHT
+            for position, business_type in enumerate(business_types):
+                score = keyword_score - position * SYNONYM_RANK_STEP
+                if score >= threshold and score > scores.get(business_type, (0, False))[0]:
+                    scores[business_type] = (score, False)
+
+    if not scores:
         # If no matches found using keywords, try fuzzy matching with business types
-        matches = process.extractBests(query, VALID_BUSINESS_TYPES, scorer=fuzz.token_set_ratio, score_cutoff=threshold)
-        matched_types = set(match[0] for match in matches)
+        matches = process.extract(query, VALID_BUSINESS_TYPES, scorer=fuzz.token_set_ratio,
+                                  processor=utils.default_process, score_cutoff=threshold, limit=None)
+        scores = {match[0]: (match[1], True) for match in matches}
+
+    # Ties go to the more specific (multi-word) type, e.g. "shoe_store" before "store"
+    ranked = sorted(scores.items(), key=lambda item: (-item[1][0], -item[0].count('_')))
+    return tuple((business_type, score, direct) for business_type, (score, direct) in ranked)
 
-    return list(matched_types)
+def clear_match_caches() -> None:
+    """
+    Clear the memoized business type matches, e.g. after the vocabulary changes.
+    """
+    _find_best_matches_cached.cache_clear()
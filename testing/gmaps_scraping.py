@@ -33,6 +33,10 @@ logging.basicConfig(
     handlers=[logging.StreamHandler()],
 )
 
+# Business names already written to each JSON Lines output file
+saved_names: Dict[str, Set[str]] = {}
+saved_names_lock = Lock()
+
 class GoogleMapsScraper:
     def __init__(self, headless: bool = True, max_threads: int = 4):
         self.headless = headless
@@ -128,32 +132,47 @@ class GoogleMapsScraper:
     @staticmethod
     def save_results_to_json(results: List[Dict[str, Any]], json_path: str):
         """
-        Saves results to a JSON file, avoiding duplicates.
+        Appends results to a JSON Lines file (one business per line), avoiding duplicates.
 
         Args:
             results (List[Dict[str, Any]]): List of new business entries to save.
-            json_path (str): Path to the JSON file.
+            json_path (str): Path to the JSON Lines file.
         """
-        try:
-            with open(json_path, 'r', encoding='utf-8') as file:
-                existing_data = json.load(file)
-                logging.info(f"Loaded {len(existing_data)} existing entries from {json_path}.")
-        except (FileNotFoundError, json.JSONDecodeError):
-            logging.warning(f"JSON file {json_path} not found or corrupted. Starting with an empty list.")
-            existing_data = []
-
-        existing_names = {entry['name'] for entry in existing_data if 'name' in entry}
-        new_entries = [entry for entry in results if entry.get('name') not in existing_names]
-        logging.info(f"New entries to add: {len(new_entries)}")
-
-        if new_entries:
-            existing_data.extend(new_entries)
-            try:
-                with open(json_path, 'w', encoding='utf-8') as file:
-                    json.dump(existing_data, file, indent=4, ensure_ascii=False)
-                logging.info(f"Saved {len(new_entries)} new entries to {json_path}")
-            except Exception as e:
-                logging.error(f"Error saving to JSON file: {e}")
+        with saved_names_lock:
+            existing_names = saved_names.get(json_path)
+            if existing_names is None:
+                # Read the file once per path; later calls only append
+                existing_names = saved_names[json_path] = set()
+                try:
+                    with open(json_path, 'r', encoding='utf-8') as file:
+                        for line in file:
+                            try:
+                                entry = json.loads(line)
+                            except json.JSONDecodeError:
+                                continue
+                            if 'name' in entry:
+                                existing_names.add(entry['name'])
+                    logging.info(f"Loaded {len(existing_names)} existing entries from {json_path}.")
+                except FileNotFoundError:
+                    logging.info(f"JSON Lines file {json_path} not found. Starting with an empty file.")
+
+            new_entries = []
+            for entry in results:
+                if entry.get('name') in existing_names:
+                    continue
+                if 'name' in entry:
+                    existing_names.add(entry['name'])
+                new_entries.append(entry)
+            logging.info(f"New entries to add: {len(new_entries)}")
+
+            if new_entries:
+                try:
+                    with open(json_path, 'a', encoding='utf-8') as file:
+                        for entry in new_entries:
+                            file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                    logging.info(f"Saved {len(new_entries)} new entries to {json_path}")
+                except Exception as e:
+                    logging.error(f"Error saving to JSON Lines file: {e}")
 
     @staticmethod
     def _clean_address(address: str, business_type: Optional[str]) -> str:
@@ -910,7 +929,7 @@ class GoogleMapsScraper:
 async def main_async():
     # User inputs
     search_query = "personal care manufacturers near denver"  # Example search query
-    json_path = 'GoogleMapsDataFast.json'
+    json_path = 'GoogleMapsDataFast.jsonl'
 
     scraper = GoogleMapsScraper(headless=True, max_threads=4)
 
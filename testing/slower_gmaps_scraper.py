@@ -1,36 +1,50 @@
-import time
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import logging
 
 
-def wait_for_panel_update(driver, old_name, max_retries=5, timeout=10):
-    for attempt in range(max_retries):
-        try:
-            # Wait for the name element to be present
-            WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.XPATH, "//h1[contains(@class, 'DUwDvf')]"))
-            )
-            
-            # Get the new name
-            new_name = driver.find_element(By.XPATH, "//h1[contains(@class, 'DUwDvf')]").text.strip()
-            
-            # Check if the name has changed
-            if new_name != old_name:
-                logging.info(f"Panel updated successfully: {old_name} -> {new_name}")
-                return True, new_name
-            else:
-                logging.warning(f"Panel name unchanged: {old_name}")
-        except (TimeoutException, StaleElementReferenceException):
-            logging.warning(f"Timeout or stale element. Attempt {attempt + 1}/{max_retries}")
-        
-        if attempt < max_retries - 1:
-            time.sleep(0.2)  # Short wait before retrying
-
-    logging.error(f"Failed to update panel after {max_retries} attempts")
-    return False, old_name
+def wait_for_panel_update(driver, old_name, timeout=10):
+    def panel_name_changed(driver):
+        # Falsy until the panel shows a non-empty name different from the previous entry's
+        new_name = driver.find_element(By.CSS_SELECTOR, "h1.DUwDvf").text.strip()
+        return new_name if new_name and new_name != old_name else False
+
+    try:
+        new_name = WebDriverWait(
+            driver,
+            timeout,
+            poll_frequency=0.05,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException),
+        ).until(panel_name_changed)
+    except TimeoutException:
+        logging.error(f"Panel did not update from {old_name!r} within {timeout}s")
+        return False, old_name
+
+    logging.info(f"Panel updated successfully: {old_name} -> {new_name}")
+    return True, new_name
+
+# Reads every panel field in one WebDriver round-trip instead of one find_element per field
+PANEL_EXTRACTION_SCRIPT = """
+const text = (selector, root) => {
+    const element = (root || document).querySelector(selector);
+    return element ? element.innerText.trim() : null;
+};
+const ratingElement = document.querySelector("div.F7nice");
+const reviews = ratingElement ? text("span[aria-label*='reviews']", ratingElement) : null;
+return {
+    name: text("h1.DUwDvf"),
+    address: text("button[data-item-id='address'] div.Io6YTe"),
+    business_type: text("button.DkEaL"),
+    website: text("a[data-item-id='authority'] div.Io6YTe"),
+    rating: ratingElement ? text("span[aria-hidden='true']", ratingElement) : null,
+    num_reviews: reviews === null ? null : reviews.replace(/[()]/g, ""),
+    phone: text("button[data-item-id*='phone:tel:'] div.Io6YTe")
+};
+"""
 
 def extract_info_from_panel(driver):
     result = {
@@ -44,49 +58,7 @@ def extract_info_from_panel(driver):
     }
 
     try:
-        # Extract name
-        try:
-            name_element = driver.find_element(By.XPATH, "//h1[contains(@class, 'DUwDvf')]")
-            result["name"] = name_element.text.strip()
-        except NoSuchElementException:
-            pass
-
-        # Extract rating and number of reviews
-        try:
-            rating_element = driver.find_element(By.XPATH, "//div[contains(@class, 'F7nice')]")
-            result["rating"] = rating_element.find_element(By.XPATH, ".//span[@aria-hidden='true']").text.strip()
-            reviews_element = rating_element.find_element(By.XPATH, ".//span[contains(@aria-label, 'reviews')]")
-            result["num_reviews"] = reviews_element.text.strip().replace('(', '').replace(')', '')
-        except NoSuchElementException:
-            pass
-
-        # Extract business type
-        try:
-            business_type_element = driver.find_element(By.XPATH, "//button[contains(@class, 'DkEaL')]")
-            result["business_type"] = business_type_element.text.strip()
-        except NoSuchElementException:
-            pass
-
-        # Extract address
-        try:
-            address_element = driver.find_element(By.XPATH, "//button[@data-item-id='address']//div[contains(@class, 'Io6YTe')]")
-            result["address"] = address_element.text.strip()
-        except NoSuchElementException:
-            pass
-
-        # Extract website
-        try:
-            website_element = driver.find_element(By.XPATH, "//a[@data-item-id='authority']//div[contains(@class, 'Io6YTe')]")
-            result["website"] = website_element.text.strip()
-        except NoSuchElementException:
-            pass
-
-        # Extract phone number
-        try:
-            phone_element = driver.find_element(By.XPATH, "//button[contains(@data-item-id, 'phone:tel:')]//div[contains(@class, 'Io6YTe')]")
-            result["phone"] = phone_element.text.strip()
-        except NoSuchElementException:
-            pass
+        result.update(driver.execute_script(PANEL_EXTRACTION_SCRIPT))
     except Exception as e:
         logging.error(f"Error in extract_info_from_panel: {str(e)}")
 
@@ -100,31 +72,41 @@ def scrape_google_maps(driver, url):
     handle_popups(driver)
 
     try:
-        wait_for_element(driver, By.XPATH, "//div[contains(@class, 'Nv2PK')]", timeout=20)
+        wait_for_element(driver, By.CSS_SELECTOR, "div.Nv2PK", timeout=20)
         logging.info("Search results loaded successfully")
     except TimeoutException:
         logging.error("Timeout waiting for search results to load")
         return []
 
-    index = 1
     results = []
     old_name = ""
+    entries = []
+    index = 0
+
+    def more_entries_loaded(driver):
+        # Cards are appended as the feed scrolls; resolves to the refreshed list once it has grown
+        found = driver.find_elements(By.CSS_SELECTOR, "div.Nv2PK")
+        return found if len(found) > len(entries) else False
+
     while True:
-        xpath = f"(//div[contains(@class, 'Nv2PK')])[{index}]"
-        try:
-            entry = wait_for_element(driver, By.XPATH, xpath, timeout=15)
-            if not entry:
-                logging.info(f"No more entries found. Stopping at index {index}.")
+        # Refresh the card list only when the cached one is exhausted, not per entry
+        if index >= len(entries):
+            try:
+                entries = WebDriverWait(driver, 15, poll_frequency=0.1).until(more_entries_loaded)
+            except TimeoutException:
+                logging.info(f"No more entries found. Stopping at index {index + 1}.")
                 break
 
-            driver.execute_script("arguments[0].scrollIntoView();", entry)
-            ActionChains(driver).move_to_element(entry).click().perform()
+        entry = entries[index]
+        index += 1
+        try:
+            driver.execute_script("arguments[0].scrollIntoView(); arguments[0].click();", entry)
             logging.info(f"Clicked on entry {index}")
 
             # Wait for panel update
-            if not wait_for_panel_update(driver, old_name, max_retries=5, timeout=10):
+            updated, _ = wait_for_panel_update(driver, old_name, timeout=10)
+            if not updated:
                 logging.warning(f"Panel did not update for entry {index}. Skipping.")
-                index += 1
                 continue
 
             # Extract information
@@ -132,23 +114,46 @@ def scrape_google_maps(driver, url):
             
             # Verify that we got new information
             if result['name'] == old_name:
-                logging.warning(f"Panel information did not change for entry {index}. Retrying.")
+                logging.warning(f"Panel information did not change for entry {index}. Skipping.")
                 continue
 
             results.append(result)
             old_name = result['name']
             logging.info(f"Successfully scraped entry {index}: {result['name']}")
 
-            index += 1
-            
-            # Wait for the next entry to be clickable
-            next_entry_xpath = f"(//div[contains(@class, 'Nv2PK')])[{index}]"
-            wait_for_element(driver, By.XPATH, next_entry_xpath, timeout=10)
-
         except Exception as e:
             logging.error(f"Error processing entry {index}: {str(e)}")
-            # Even if an error occurs, we move to the next entry
-            index += 1
 
     logging.info(f"Scraping completed. Found {len(results)} entries.")
     return results
+
+def scrape_place_details(drivers, hrefs):
+    # Each worker opens place pages directly on its own driver, skipping the click-through list
+    driver_pool = Queue()
+    for driver in drivers:
+        driver_pool.put(driver)
+
+    def worker_extract(href):
+        driver = driver_pool.get()
+        try:
+            driver.get(href)
+            WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "h1.DUwDvf"))
+            )
+            result = extract_info_from_panel(driver)
+            result["href"] = href
+            return result
+        except TimeoutException:
+            logging.warning(f"Timeout waiting for place panel: {href}")
+            return None
+        except Exception as e:
+            logging.error(f"Error scraping place {href}: {str(e)}")
+            return None
+        finally:
+            driver_pool.put(driver)
+
+    with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+        results = [result for result in executor.map(worker_extract, hrefs) if result]
+
+    logging.info(f"Scraped details for {len(results)} of {len(hrefs)} places.")
+    return results
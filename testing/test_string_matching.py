@@ -0,0 +1,55 @@
+"""
+Regression checks for business type fuzzy matching.
+
+Run with ``python -m pytest testing/test_string_matching.py``.
+"""
+
+import os
+
+# app.utils.config requires these at import time; the matcher itself never reads them
+for _var in ("API_KEY", "GOOGLE_MAPS_API_KEY", "BASE_URL", "SUPABASE_URL", "SUPABASE_KEY"):
+    os.environ.setdefault(_var, "test")
+
+from app.utils.config import VALID_BUSINESS_TYPES_SET
+from app.utils.string_matching import find_best_matches, find_scored_matches, select_business_types
+
+def test_short_words_do_not_match_unrelated_types():
+    # rapidfuzz's partial_ratio scored "car" vs "cafe" and "hair" vs "airport" above the threshold
+    assert set(find_best_matches("hair salon")) == {"hair_care", "beauty_salon"}
+    assert set(find_best_matches("car detailing")) >= {"car_repair", "car_wash", "car_dealer"}
+    assert not {"restaurant", "cafe", "bar"} & set(find_best_matches("car detailing"))
+
+def test_plural_queries_match_their_type():
+    assert find_best_matches("bakeries")[0] == "bakery"
+    assert find_best_matches("pharmacies")[0] == "pharmacy"
+    assert find_best_matches("gas stations")[0] == "gas_station"
+
+def test_unknown_business_types_fall_through_to_scraper():
+    assert find_best_matches("tattoo parlor") == []
+    assert find_best_matches("pet grooming") == []
+
+def test_matches_are_valid_types_sorted_by_score():
+    for query in ("hair salon", "italian restaurants", "shoe stores", "hotels", "coffee shop"):
+        matches = find_scored_matches(query)
+        assert matches, query
+        assert all(business_type in VALID_BUSINESS_TYPES_SET for business_type, _, _ in matches)
+        assert [score for _, score, _ in matches] == sorted((score for _, score, _ in matches), reverse=True)
+    assert find_best_matches("italian restaurants")[0] == "restaurant"
+    assert find_best_matches("shoe stores")[0] == "shoe_store"
+    assert find_best_matches("hotels") == ["lodging"]
+
+def test_keyword_expansions_never_tie():
+    for query in ("coffee shop", "bike shop", "hair salon", "car detailing", "restaurant"):
+        synonym_scores = [score for _, score, direct in find_scored_matches(query) if not direct]
+        assert len(synonym_scores) == len(set(synonym_scores)), query
+    # The keyword's own list order decides the ranking
+    assert find_best_matches("coffee shop")[:2] == ["store", "shopping_mall"]
+
+def test_keyword_expansions_are_not_combined_in_one_search():
+    # "shop" expands to several store types; only the single best one may be searched
+    assert select_business_types("coffee shop") == ["store"]
+    assert select_business_types("bike shop") == ["store"]
+    assert select_business_types("hair salon") == ["hair_care"]
+    assert select_business_types("pet store") == ["pet_store"]
+    assert select_business_types("italian restaurants") == ["restaurant"]
+    assert select_business_types("tattoo parlor") == []
@@ -0,0 +1,112 @@
+"""
+Regression checks for coalescing identical lead requests in TaskManager.
+
+Run with ``python -m pytest testing/test_task_manager.py``.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+# app.utils.config requires these at import time; the task manager never reads them
+for _var in ("API_KEY", "GOOGLE_MAPS_API_KEY", "BASE_URL", "SUPABASE_URL", "SUPABASE_KEY"):
+    os.environ.setdefault(_var, "test")
+
+tasks = pytest.importorskip("app.tasks", reason="app.tasks needs the full worker dependencies")
+states = tasks.states
+
+class FakeLeadsTask:
+    """Stands in for the Celery task: counts publishes and reports a fixed state."""
+
+    def __init__(self, state: str = states.PENDING, fail_first: bool = False, publish_seconds: float = 0.1):
+        self.state = state
+        self.fail_first = fail_first
+        self.publish_seconds = publish_seconds
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def delay(self, *args):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        time.sleep(self.publish_seconds)
+        if self.fail_first and call == 1:
+            raise RuntimeError("broker unavailable")
+        return SimpleNamespace(id=f"task-{call}")
+
+    def AsyncResult(self, task_id):
+        return SimpleNamespace(state=self.state)
+
+def install(monkeypatch, fake: FakeLeadsTask) -> "tasks.TaskManager":
+    monkeypatch.setattr(tasks, "fetch_leads_task", fake)
+    return tasks.TaskManager()
+
+def request(manager, query: str = "cafes in paris"):
+    return manager.fetch_leads(query=query, max_leads=10, fields=None, user_id="user-1")
+
+def test_concurrent_identical_requests_share_one_publish(monkeypatch):
+    fake = FakeLeadsTask()
+    manager = install(monkeypatch, fake)
+
+    async def run():
+        return await asyncio.gather(request(manager), request(manager), request(manager))
+
+    assert asyncio.run(run()) == ["task-1"] * 3
+    assert fake.calls == 1
+
+def test_different_requests_are_not_coalesced(monkeypatch):
+    fake = FakeLeadsTask()
+    manager = install(monkeypatch, fake)
+
+    async def run():
+        return await asyncio.gather(request(manager, "cafes in paris"), request(manager, "bars in paris"))
+
+    assert sorted(asyncio.run(run())) == ["task-1", "task-2"]
+    assert fake.calls == 2
+
+def test_publish_failure_lets_waiters_queue_their_own_task(monkeypatch):
+    fake = FakeLeadsTask(fail_first=True)
+    manager = install(monkeypatch, fake)
+
+    async def run():
+        first = asyncio.ensure_future(request(manager))
+        await asyncio.sleep(0.01)
+        return await asyncio.gather(first, request(manager), return_exceptions=True)
+
+    first_result, waiter_result = asyncio.run(run())
+    assert isinstance(first_result, RuntimeError)
+    assert waiter_result == "task-2"
+    assert manager._inflight  # Only the waiter's own task remains tracked
+
+def test_cancelled_publish_lets_waiters_queue_their_own_task(monkeypatch):
+    fake = FakeLeadsTask(publish_seconds=0.2)
+    manager = install(monkeypatch, fake)
+
+    async def run():
+        first = asyncio.ensure_future(request(manager))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.ensure_future(request(manager))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await asyncio.wait_for(waiter, timeout=5)
+
+    assert asyncio.run(run()) == "task-2"
+    assert fake.calls == 2
+
+def test_finished_task_is_not_reused(monkeypatch):
+    fake = FakeLeadsTask(publish_seconds=0)
+    manager = install(monkeypatch, fake)
+
+    async def run():
+        first = await request(manager)
+        fake.state = states.SUCCESS
+        return first, await request(manager)
+
+    assert asyncio.run(run()) == ("task-1", "task-2")
+    assert fake.calls == 2